@@ -38,6 +38,8 @@ class Settings(BaseSettings):
     RINGCENTRAL_JWT: str = os.getenv("RINGCENTRAL_JWT", "")
     RINGCENTRAL_API_URL: str = os.getenv("RINGCENTRAL_API_URL", "https://platform.ringcentral.com")
     RINGCENTRAL_STRICT_RATE_LIMIT: bool = os.getenv("RINGCENTRAL_STRICT_RATE_LIMIT", "true").lower() in {"1", "true", "yes"}
+    # Connection pool size of the shared session used for recording downloads
+    RINGCENTRAL_MAX_CONNECTIONS: int = int(os.getenv("RINGCENTRAL_MAX_CONNECTIONS", "64"))
 
     # Azure Service Bus
     AZURE_SERVICEBUS_CONNECTION_STRING: Optional[str] = None
@@ -48,6 +50,10 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")    
     OPENAI_TRANSCRIPTION_MODEL: str = os.getenv("OPENAI_TRANSCRIPTION_MODEL", "whisper-1")
     OPENAI_INSIGHTS_MODEL: str = os.getenv("OPENAI_INSIGHTS_MODEL", "gpt-4o-mini")
+    # Connection pool size shared by the async Azure OpenAI clients
+    OPENAI_MAX_CONNECTIONS: int = int(os.getenv("OPENAI_MAX_CONNECTIONS", "100"))
+    # Maximum requests in flight per Azure OpenAI deployment
+    OPENAI_MAX_CONCURRENCY: int = int(os.getenv("OPENAI_MAX_CONCURRENCY", "16"))
 
     # Azure OpenAI Settings
     AZURE_OPENAI_API_KEY: Optional[str] = os.getenv("AZURE_OPENAI_API_KEY", None)
@@ -62,6 +68,21 @@ class Settings(BaseSettings):
     AZURE_OPENAI_WHISPER_ENDPOINT: Optional[str] = os.getenv("AZURE_OPENAI_WHISPER_ENDPOINT", None)
     AZURE_OPENAI_WHISPER_API_VERSION: Optional[str] = os.getenv("AZURE_OPENAI_WHISPER_API_VERSION", None)
 
+    # ASR Analysis Settings
+    # Maximum number of calls manual transcription processes at once
+    ASR_CONCURRENCY: int = int(os.getenv("ASR_CONCURRENCY", "8"))
+    # How long a stored transcription is reused before a recording is transcribed again
+    ASR_CACHE_TTL_HOURS: int = int(os.getenv("ASR_CACHE_TTL_HOURS", "168"))
+    # Cursor batch size for manual transcription; 0 keeps the driver default
+    ASR_MONGO_BATCH_SIZE: int = int(os.getenv("ASR_MONGO_BATCH_SIZE", "0"))
+    # Transcripts shorter than this (missed calls, voicemail, noise) skip the LLM analysis
+    ANALYSIS_MIN_CHARS: int = int(os.getenv("ANALYSIS_MIN_CHARS", "40"))
+    ANALYSIS_MIN_DURATION_SECONDS: float = float(os.getenv("ANALYSIS_MIN_DURATION_SECONDS", "3"))
+    # Longer transcripts keep only their opening and closing turns in the analysis prompt
+    ANALYSIS_MAX_TRANSCRIPT_CHARS: int = int(os.getenv("ANALYSIS_MAX_TRANSCRIPT_CHARS", "30000"))
+    # How long an analysis response is reused for an identical prompt
+    ANALYSIS_CACHE_TTL_DAYS: int = int(os.getenv("ANALYSIS_CACHE_TTL_DAYS", "7"))
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,5 +1,6 @@
 import logging
 from typing import Optional
+from pymongo import DESCENDING
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
 from app.core.config import settings
@@ -40,6 +41,32 @@ class MongoDB:
             self.database = None
             logger.info("Disconnected from MongoDB")
     
+    async def ensure_indexes(self) -> None:
+        """Create the indexes the application queries rely on."""
+        calls = self.get_collection("calls")
+        # Backs the "latest calls with a recording" query used by manual transcription.
+        # The query sorts on (createdAt, _id) and filters on ringCentralId with $exists/$ne,
+        # so the sort keys lead and the filter becomes a partial index condition; a leading
+        # ringCentralId key would be a range scan the sort could not walk in order
+        await calls.create_index(
+            [("createdAt", DESCENDING), ("_id", DESCENDING)],
+            name="createdAt_id_with_ringCentralId",
+            partialFilterExpression={"ringCentralId": {"$exists": True}},
+        )
+        # Expire cached transcriptions once they are older than the ASR cache TTL
+        await self.get_collection("asr_cache").create_index(
+            "createdAt",
+            name="createdAt_ttl",
+            expireAfterSeconds=settings.ASR_CACHE_TTL_HOURS * 3600,
+        )
+        # Expire cached call analyses once they are older than the analysis cache TTL
+        await self.get_collection("analysis_cache").create_index(
+            "createdAt",
+            name="createdAt_ttl",
+            expireAfterSeconds=settings.ANALYSIS_CACHE_TTL_DAYS * 86400,
+        )
+        logger.info("MongoDB indexes ensured")
+    
     def get_collection(self, name: str):
         """Get a collection."""
         if self.database is None:
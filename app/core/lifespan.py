@@ -10,6 +10,8 @@ from app.services.scheduler import scheduler
 
 from app.core.config import settings
 from app.core.database.mongodb import db
+from app.core.openai_client import close_async_http_client
+from app.ringcentral.service import close_http_session
 
 
 # Configure logger
@@ -33,6 +35,10 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("🔌 Connecting to MongoDB...", extra={'tag': 'lifecycle'})
     await db.connect()
+    try:
+        await db.ensure_indexes()
+    except Exception as e:
+        logger.warning(f"Failed to ensure MongoDB indexes: {e}")
 
     logger.info("🚀 Starting Service Bus Manager...")
     service_bus_manager = ServiceBusManager()
@@ -50,6 +56,9 @@ async def lifespan(app: FastAPI):
     # Stop Scheduler
     scheduler.stop()
 
+    await close_http_session()
+    await close_async_http_client()
+
     logger.info("🔌 Disconnecting from MongoDB...")
     await db.disconnect()
     
@@ -1,5 +1,6 @@
 from functools import lru_cache
-from openai import OpenAI, AzureOpenAI
+import httpx
+from openai import OpenAI, AzureOpenAI, AsyncAzureOpenAI, DefaultAsyncHttpxClient
 from app.core.config import settings
 
 # Cached OpenAI client instance
@@ -53,4 +54,59 @@ def get_azure_openai_whisper_client() -> AzureOpenAI:
         api_key=settings.AZURE_OPENAI_WHISPER_API_KEY,
         api_version=settings.AZURE_OPENAI_WHISPER_API_VERSION,
         azure_endpoint=settings.AZURE_OPENAI_WHISPER_ENDPOINT
-    )
\ No newline at end of file
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_async_http_client() -> httpx.AsyncClient:
+    """
+    Shared connection pool for the async Azure OpenAI clients.
+    Sized so concurrent transcriptions are not capped by httpx's default pool.
+    """
+    return DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=settings.OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OPENAI_MAX_CONNECTIONS,
+        )
+    )
+
+
+async def close_async_http_client() -> None:
+    """Close the shared async connection pool and drop the clients built on it."""
+    if _get_async_http_client.cache_info().currsize:
+        await _get_async_http_client().aclose()
+    _get_async_http_client.cache_clear()
+    get_async_azure_openai_client.cache_clear()
+    get_async_azure_openai_whisper_client.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def get_async_azure_openai_client() -> AsyncAzureOpenAI:
+    """
+    Get the async Azure OpenAI client for chat completions.
+    Requests run natively on the event loop instead of in worker threads.
+    Retries are left to the callers' tenacity policy.
+    """
+    return AsyncAzureOpenAI(
+        api_key=settings.AZURE_OPENAI_API_KEY,
+        api_version=settings.AZURE_OPENAI_API_VERSION,
+        azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
+        max_retries=0,
+        http_client=_get_async_http_client()
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_azure_openai_whisper_client() -> AsyncAzureOpenAI:
+    """
+    Get the async Azure OpenAI client for Whisper transcription.
+    Uses the dedicated Whisper endpoint and deployment.
+    Retries are left to the callers' tenacity policy.
+    """
+    return AsyncAzureOpenAI(
+        api_key=settings.AZURE_OPENAI_WHISPER_API_KEY,
+        api_version=settings.AZURE_OPENAI_WHISPER_API_VERSION,
+        azure_endpoint=settings.AZURE_OPENAI_WHISPER_ENDPOINT,
+        max_retries=0,
+        http_client=_get_async_http_client()
+    )
@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import os
+import shutil
 import tempfile
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Sequence
@@ -12,6 +14,7 @@ from pydantic import ValidationError
 from .schemas import (
     AudioProcessingMessageRequest,
     ContactExtraction,
+    ReformatTagsRequest,
     TranscriptUtterance,
     TranscribeResponse,
     TranscribeUrlRequest,
@@ -19,6 +22,7 @@ from .schemas import (
     VehicleTag,
 )
 from .service import transcribe, manual_transcribe
+from .tag_service import update_call_tags_bulk
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -29,12 +33,14 @@ logger = logging.getLogger(__name__)
 # )
 logger.setLevel(logging.INFO)
 
+UPLOAD_COPY_CHUNK_SIZE = 1024 * 1024
+
 
 @router.post("/transcribe/url", response_model=TranscribeResponse, summary="Transcribe audio from a URL")
 async def transcribe_url(body: TranscribeUrlRequest) -> TranscribeResponse:
     """Transcribe audio from a URL"""
     try:
-        transcription_result = await transcribe(url=str(body.audio_url))
+        transcription_result = await transcribe(url=str(body.audio_url), force=body.force)
         logger.info("Transcription successful for ID=%s ✅", body.ring_central_id)
         return _build_transcribe_response(transcription_result, ring_central_id=body.ring_central_id)
     except RingCentralRateLimitActive as rle:
@@ -65,6 +71,19 @@ async def manual_transcribe_endpoint(limit: int = 1) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail=f"Failed to manually transcribe: {exc}") from exc
 
 
+@router.post("/tags/reformat", summary="Migrate stored call tags to the structured format")
+async def reformat_tags_endpoint(body: ReformatTagsRequest) -> Dict[str, Any]:
+    """Rewrite the `tags` field of the given calls in one batched pass."""
+    try:
+        updated = await update_call_tags_bulk(body.call_ids)
+        return {"requested": len(body.call_ids), "updated": updated}
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    except Exception as exc:
+        logger.error("Tag reformat failed for %d calls: %s", len(body.call_ids), exc)
+        raise HTTPException(status_code=500, detail=f"Failed to reformat tags: {exc}") from exc
+
+
 @router.post("/transcribe/id", response_model=TranscribeResponse, summary="Transcribe audio from RingCentral recording ID")
 async def transcribe_id(body: TranscribeIdRequest) -> TranscribeResponse:
     """Transcribe audio from a RingCentral recording ID."""
@@ -94,8 +113,8 @@ async def transcribe_file(
     try:
         suffix = os.path.splitext(file.filename or "upload")[1]
         with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            content = await file.read()
-            tmp.write(content)
+            # Stream the spooled upload to disk in 1 MiB blocks instead of reading it into memory
+            await asyncio.to_thread(shutil.copyfileobj, file.file, tmp, UPLOAD_COPY_CHUNK_SIZE)
             tmp.flush()
             tmp_path = tmp.name
             
@@ -148,6 +167,10 @@ def _normalize_transcription(data: Optional[List[Dict[str, Any]]]) -> List[Trans
     if not data:
         return []
 
+    # One reference time for the whole transcript instead of a clock read per
+    # turn; most turns fall back to it, so format it once as well
+    base_time = datetime.now(timezone.utc)
+    base_iso = base_time.isoformat()
     turns: List[TranscriptUtterance] = []
     for item in data:
         if not isinstance(item, dict):
@@ -158,7 +181,7 @@ def _normalize_transcription(data: Optional[List[Dict[str, Any]]]) -> List[Trans
         speaker = str(item.get("speaker") or "").strip().lower()
         if speaker not in {"agent", "customer"}:
             speaker = "agent"
-        timestamp = _normalize_timestamp(item.get("timestamp") or item.get("start"))
+        timestamp = _normalize_timestamp(item.get("timestamp") or item.get("start"), base_time, base_iso)
         turns.append(
             TranscriptUtterance(
                 speaker=speaker,
@@ -169,7 +192,11 @@ def _normalize_transcription(data: Optional[List[Dict[str, Any]]]) -> List[Trans
     return turns
 
 
-def _normalize_timestamp(raw: Any) -> Dict[str, str]:
+def _normalize_timestamp(
+    raw: Any,
+    base_time: Optional[datetime] = None,
+    base_iso: Optional[str] = None,
+) -> Dict[str, str]:
     if isinstance(raw, dict):
         if "$date" in raw and isinstance(raw["$date"], str):
             return {"$date": raw["$date"]}
@@ -179,10 +206,12 @@ def _normalize_timestamp(raw: Any) -> Dict[str, str]:
             return {"$date": raw["value"]}
     if isinstance(raw, str) and raw:
         return {"$date": raw}
-    if isinstance(raw, (int, float)):
+    if base_time is None:
         base_time = datetime.now(timezone.utc)
+        base_iso = None
+    if isinstance(raw, (int, float)):
         return {"$date": (base_time + timedelta(seconds=float(raw))).isoformat()}
-    return {"$date": datetime.now(timezone.utc).isoformat()}
+    return {"$date": base_iso or base_time.isoformat()}
 
 
 def _normalize_keywords(raw: Optional[List[Any]]) -> List[str]:
@@ -11,6 +11,8 @@ class TranscribeUrlRequest(BaseModel):
         default=None,
         validation_alias=AliasChoices("ring_central_id", "ringCentralId"),
     )
+    # Re-run the transcription even if a cached result exists for this URL
+    force: bool = False
 
 
 class AudioProcessingMessageRequest(BaseModel):
@@ -79,6 +81,13 @@ class TranscribeIdRequest(BaseModel):
     recording_id: str
 
 
+class ReformatTagsRequest(BaseModel):
+    """Request model for migrating the stored tags of several calls to the structured format."""
+    model_config = ConfigDict(populate_by_name=True)
+
+    call_ids: List[str] = Field(validation_alias=AliasChoices("call_ids", "callIds"))
+
+
 class TranscriptionResult(BaseModel):
     """Result model for transcription with call analysis."""
     model_config = ConfigDict(populate_by_name=True)
@@ -1,32 +1,308 @@
 import asyncio
 import hashlib
-import json
 import logging
-import mimetypes
 import os
 import re
+import tempfile
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import orjson
+from openai import APIConnectionError, AsyncAzureOpenAI, InternalServerError, RateLimitError
+from openai.types.chat import ChatCompletion
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 from app.core.config import settings
 from app.core.database.mongodb import db
 from app.core.openai_client import (
-    get_azure_openai_whisper_client,
-    get_azure_openai_client,
+    get_async_azure_openai_client,
+    get_async_azure_openai_whisper_client,
     get_openai_client,
 )
 from app.ringcentral.service import download_audio, get_recording_audio_url
-from app.services.azure.openai.whisper_rateLimiter import whisper_rate_limiter
+from app.services.azure.openai.openai_rateLimiter import (
+    azure_openai_rate_limiter,
+    azure_openai_whisper_rate_limiter,
+)
 from app.services.openai.local_whisper import local_whisper
 
 
 
-from .schemas import TranscriptionResult
+from .schemas import ContactExtraction, TranscriptionResult
 
 logger = logging.getLogger(__name__)
 
+# In-flight temporary file cleanups scheduled by transcribe()
+_cleanup_tasks: Set[asyncio.Task] = set()
+
+# Maximum number of call updates manual_transcribe sends in one bulk write
+_WRITE_BATCH_SIZE = 100
+
+# Most recent analyses kept in process, in front of the analysis_cache
+# collection, as cache key -> (monotonic expiry, analysis JSON)
+_ANALYSIS_MEMORY_CACHE_SIZE = 256
+_analysis_memory_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+# Retry transient OpenAI failures (connection resets, 429s, 5xx) with jittered
+# exponential backoff; the SDK's own retries are disabled on the async clients
+_openai_retry = retry(
+    wait=wait_random_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(5),
+    retry=retry_if_exception_type((APIConnectionError, RateLimitError, InternalServerError)),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True,
+)
+
+# Azure deployment used for the call analysis completion
+_CALL_ANALYSIS_MODEL = "gpt-4.1"
+
+# Structured output schema for the call analysis completion
+_CALL_ANALYSIS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "keywords": {
+            "type": "array",
+            "items": {
+                "type": "string"
+            },
+            "minItems": 0
+        },
+        "summary": {
+            "type": ["string", "null"]
+        },
+        "tags": {
+            "type": "array",
+            "items": {
+                "type": "string"
+            },
+            "description": "Vehicle-related terms (makes, models, types) as clean strings without frequency counts, Eg: {'ford': '8'},'{transit custom': '8'}}"
+        },
+        "sentiment": {
+            "type": ["number", "null"]
+        },
+        "mql_score": {
+            "type": ["number", "null"]
+        },
+        "rating": {
+            "type": ["number", "null"]
+        },
+        "call_type": {
+            "type": ["string", "null"]
+        },
+        "buyer_intent_score": {
+            "type": ["number", "null"]
+        },
+        "buyer_intent_reason": {
+            "type": ["string", "null"]
+        },
+        "agent_recommendation": {
+            "type": ["string", "null"]
+        },
+        "analysis": {
+            "type": ["string", "null"]
+        },
+        "contacts": {
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": ["string", "null"]
+                },
+                "email": {
+                    "type": ["string", "null"],
+                    "format": "email"
+                },
+                "phone": {
+                    "type": ["string", "null"]
+                },
+                "company": {
+                    "type": ["string", "null"]
+                },
+                "address": {
+                    "type": ["string", "null"]
+                },
+                "city": {
+                    "type": ["string", "null"]
+                }
+            },
+            "required": ["name", "email", "phone", "company", "address", "city"],
+            "additionalProperties": False
+        }
+    },
+    "required": ["keywords", "summary", "tags", "sentiment", "mql_score", "rating", "call_type", "buyer_intent_score", "buyer_intent_reason", "agent_recommendation", "analysis", "contacts"],
+    "additionalProperties": False
+}
+
+_CALL_ANALYSIS_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "call_analysis",
+        "schema": _CALL_ANALYSIS_SCHEMA,
+        "strict": True
+    }
+}
+# Stable serialization of the response format, so changing the schema invalidates cached analyses
+_CALL_ANALYSIS_RESPONSE_FORMAT_JSON = orjson.dumps(
+    _CALL_ANALYSIS_RESPONSE_FORMAT, option=orjson.OPT_SORT_KEYS
+).decode("utf-8")
+
+_CALL_ANALYSIS_SYSTEM_PROMPT = (
+    "You are an assistant that analyzes van-related customer conversations of Vanaways."
+    "Provide concise, accurate, and structured insights based on the transcript."
+    "Analyze properly and do not make up information."
+)
+
+# Filled in with str.format(conversation=...); literal braces are doubled.
+# The transcript goes last so every request shares the same instruction prefix,
+# which lets the service's prompt cache skip prefill for it.
+_CALL_ANALYSIS_PROMPT_TEMPLATE = """
+    Analyze this Vanaways sales call transcript and extract the required information.
+
+    For each of the following, analyze the transcript and provide the result in the specified format:
+
+    - keywords: Extract the most important keywords and phrases from this van-related conversation. Focus on vehicle types, models, makes, leasing/sales terms, business needs, and action items. Return only a JSON array of strings, e.g. ["keyword1", "keyword2", "keyword3"].
+    - mql_assessment: Score this van-related conversation as a Marketing Qualified Lead (MQL) from 0 to 10. Consider: interest level, budget signals, authority to decide, urgency, and product fit. Return only the number.
+    - sentiment_analysis: Rate the overall sentiment of this van-related customer conversation from 0 (very negative) to 10 (very positive). Consider satisfaction, tone, agent helpfulness, issue resolution, and engagement. Return only the number.
+    - customer_rating: Based on this van-related conversation, rate how satisfied the customer seems. Scale: 0 = very unhappy, 5-6 = neutral, 9-10 = very happy. Return only the number.
+    - call_type: Classify this van-related conversation into one of: "High Score", "Hot Lead", "Customer Issue", "General Inquiry", "Follow Up", "Other". Return only the category name.
+    - summary: Provide a concise one-line summary of this van-related conversation (max 100 characters). Example: "Customer needs leasing for 5 Ford Transit vans, asks for pricing this month".
+    - vehicle_tags: Extract all vehicle-related terms from this conversation (makes, models, types). Count frequency of each term. Return only valid JSON. Example: {{"ford": "2", "transit": "3", "van": "5"}}. If none, return {{}}.
+    - contact_extraction: From this van-related conversation, extract ONLY the CUSTOMER's name (first name is fine if full name not given) and email address if present. Ignore any names that are followed by 'from Vanaways' or similar, since those are Agents. Correct any 'Banaways' typos to 'Vanaways'. Return ONLY JSON in this exact format: {{"name":"<name or empty>","email":"<email or empty>"}}.
+    - Purchase intent signals and next steps: Make sure buyer_intent_score is only calculated from clear purchase intent signals (If call is being to sales call then analyze for intent, otherwise return 0), same for buyer_intent_reason if not then empty string.
+    - agent_recommendation: Based on this van-related conversation, suggest the best next action for the sales agent.
+    - Provide a detailed analysis of the call, including strengths and weaknesses of the sales approach.
+
+    NOTE: If the transcript is empty or lacks meaningful content, respond with null, empty lists, or 0 for all fields as appropriate.
+
+    Provide a complete analysis with insights that would help Vanaways improve their sales process.
+
+    Transcript:
+    {conversation}
+    """
+
+def _is_recently_transcribed(updated_at: Optional[datetime]) -> bool:
+    """Return True when a call's stored transcription is still within ASR_CACHE_TTL_HOURS."""
+    if not isinstance(updated_at, datetime):
+        return False
+    if updated_at.tzinfo is None:
+        # Motor returns naive datetimes in UTC by default
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - updated_at < timedelta(hours=settings.ASR_CACHE_TTL_HOURS)
+
+
+async def _process_one(
+    call_data: Dict[str, Any],
+    write_queue: "asyncio.Queue[Optional[Tuple[Any, UpdateOne]]]",
+) -> Optional[Dict[str, Any]]:
+    """Transcribe a single call and queue the update for its MongoDB document."""
+    call_id = call_data.get("_id")
+    ring_central_id = (
+        call_data.get("ringCentralId")
+        or call_data.get("ring_central_id")
+        or call_data.get("recordingId")
+    )
+
+    if not ring_central_id:
+        logger.warning("Skipping call %s without ringCentralId", call_id)
+        return None
+
+    if _is_recently_transcribed(call_data.get("transcriptionUpdatedAt")):
+        logger.info("Skipping call %s transcribed within the cache TTL", call_id)
+        return {
+            "call_id": str(call_id) if call_id is not None else None,
+            "ring_central_id": ring_central_id,
+            "status": (call_data.get("transcriptionResult") or {}).get("status", "cached"),
+        }
+
+    try:
+        audio_url = await get_recording_audio_url(str(ring_central_id))
+        transcription = await transcribe(url=audio_url)
+    except Exception:
+        logger.exception(
+            "Manual transcription failed for ringCentralId=%s", ring_central_id
+        )
+        return None
+
+    # Unset optional fields are dropped to keep the stored document small
+    transcription_payload = transcription.model_dump(exclude_none=True)
+
+    update_doc: Dict[str, Any] = {
+        "callAnalysis": transcription.call_analysis,
+        "transcriptionResult": transcription_payload,
+        "transcriptionUpdatedAt": datetime.now(timezone.utc),
+    }
+    await write_queue.put((call_id, UpdateOne({"_id": call_id}, {"$set": update_doc})))
+
+    return {
+        "call_id": str(call_id) if call_id is not None else None,
+        "ring_central_id": ring_central_id,
+        "status": transcription.status,
+    }
+
+
+async def _transcription_worker(
+    call_queue: "asyncio.Queue[Dict[str, Any]]",
+    write_queue: "asyncio.Queue[Optional[Tuple[Any, UpdateOne]]]",
+    processed: List[Dict[str, Any]],
+) -> None:
+    """Pipeline stage: transcribe queued calls until cancelled."""
+    while True:
+        call_data = await call_queue.get()
+        try:
+            result = await _process_one(call_data, write_queue)
+            if result is not None:
+                processed.append(result)
+        except Exception:
+            logger.exception("Manual transcription failed for call %s", call_data.get("_id"))
+        finally:
+            call_queue.task_done()
+
+
+async def _write_stage(
+    calls_collection: Any,
+    write_queue: "asyncio.Queue[Optional[Tuple[Any, UpdateOne]]]",
+) -> Set[Any]:
+    """
+    Pipeline stage: bulk write queued call updates until a None sentinel arrives.
+
+    Returns the _id of every call whose update was not stored.
+    """
+    failed: Set[Any] = set()
+    batch: List[Tuple[Any, UpdateOne]] = []
+    while True:
+        item = await write_queue.get()
+        if item is not None:
+            batch.append(item)
+        # Flush whenever the writer catches up so results land while other
+        # calls are still being transcribed
+        if batch and (item is None or write_queue.empty() or len(batch) >= _WRITE_BATCH_SIZE):
+            try:
+                await calls_collection.bulk_write([update for _, update in batch], ordered=False)
+            except BulkWriteError as exc:
+                # Unordered writes carry on past a failure, so only the reported ops are lost
+                write_errors = exc.details.get("writeErrors", [])
+                failed.update(batch[error["index"]][0] for error in write_errors)
+                logger.error("Failed to store %d manual transcriptions: %s", len(write_errors), exc)
+            except Exception as exc:
+                failed.update(call_id for call_id, _ in batch)
+                logger.error("Failed to store %d manual transcriptions: %s", len(batch), exc)
+            batch = []
+        if item is None:
+            return failed
+
+
 async def manual_transcribe(limit: int = 1) -> List[Dict[str, Any]]:
     """Manually transcribe the most recent calls in MongoDB."""
 
@@ -43,62 +319,67 @@ async def manual_transcribe(limit: int = 1) -> List[Dict[str, Any]]:
         logger.error("Unable to access MongoDB: %s", exc)
         raise
 
+    # Only pull the identifiers we need; full call documents carry large
+    # embedded transcripts that would otherwise be transferred for nothing
     cursor = (
         calls_collection
-        .find({"ringCentralId": {"$exists": True, "$ne": None}})
+        .find(
+            {"ringCentralId": {"$exists": True, "$ne": None}},
+            projection={
+                "_id": 1,
+                "ringCentralId": 1,
+                "ring_central_id": 1,
+                "recordingId": 1,
+                "transcriptionUpdatedAt": 1,
+                "transcriptionResult.status": 1,
+            },
+        )
         .sort([("createdAt", -1), ("_id", -1)])
         .limit(limit)
     )
-
-    calls = await cursor.to_list(length=limit)
-
-    print(f"\nFound {len(calls)} calls to process")
-
+    # Projected documents are tiny, so the driver's default batching is kept
+    # unless a smaller batch size is configured to cap per-round-trip memory
+    if settings.ASR_MONGO_BATCH_SIZE > 0:
+        cursor = cursor.batch_size(settings.ASR_MONGO_BATCH_SIZE)
+
+    # Run the batch as a pipeline: the cursor feeds a bounded queue, a fixed
+    # pool of workers transcribes calls concurrently, and a single writer
+    # stores finished results while the remaining calls are still in flight
+    call_queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=settings.ASR_CONCURRENCY * 2)
+    write_queue: "asyncio.Queue[Optional[Tuple[Any, UpdateOne]]]" = asyncio.Queue()
     processed: List[Dict[str, Any]] = []
 
-    for call_data in calls:
-        call_id = call_data.get("_id")
-        ring_central_id = (
-            call_data.get("ringCentralId")
-            or call_data.get("ring_central_id")
-            or call_data.get("recordingId")
-        )
-
-        if not ring_central_id:
-            logger.warning("Skipping call %s without ringCentralId", call_id)
-            continue
-
-        try:
-            audio_url = await get_recording_audio_url(str(ring_central_id))
-            transcription = await transcribe(url=audio_url)
-            transcription_payload = transcription.model_dump()
-
-            update_doc: Dict[str, Any] = {
-                "callAnalysis": transcription.call_analysis,
-                "transcriptionResult": transcription_payload,
-                "transcriptionUpdatedAt": datetime.now(timezone.utc),
-            }
-
-            await calls_collection.update_one(
-                {"_id": call_id},
-                {"$set": update_doc}
-            )
-
-            processed.append(
-                {
-                    "call_id": str(call_id) if call_id is not None else None,
-                    "ring_central_id": ring_central_id,
-                    "status": transcription.status,
-                }
-            )
-        except Exception as exc:
-            logger.exception(
-                "Manual transcription failed for ringCentralId=%s", ring_central_id
-            )
-
-    if disconnect_after:
-        await db.disconnect()
+    workers = [
+        asyncio.create_task(_transcription_worker(call_queue, write_queue, processed))
+        for _ in range(settings.ASR_CONCURRENCY)
+    ]
+    writer = asyncio.create_task(_write_stage(calls_collection, write_queue))
 
+    try:
+        async for call_data in cursor:
+            await call_queue.put(call_data)
+        await call_queue.join()
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        await write_queue.put(None)
+        failed_ids = await writer
+
+        if disconnect_after:
+            await db.disconnect()
+
+    # A transcription that never reached MongoDB is reported as failed, not completed
+    failed_call_ids = {str(call_id) for call_id in failed_ids}
+    for result in processed:
+        if result["call_id"] in failed_call_ids:
+            result["status"] = "failed"
+
+    logger.info(
+        "Manual transcription processed %d calls (%d not stored)",
+        len(processed),
+        len(failed_call_ids),
+    )
     return processed
     
 
@@ -113,13 +394,18 @@ async def manual_transcribe(limit: int = 1) -> List[Dict[str, Any]]:
     except Exception as e:
         logger.error(f"Local Whisper transcription failed: {e}")
         raise
-async def transcribe(recording_id: Optional[str] = None, url: Optional[str] = None) -> TranscriptionResult:
+async def transcribe(
+    recording_id: Optional[str] = None,
+    url: Optional[str] = None,
+    force: bool = False,
+) -> TranscriptionResult:
     """
     Transcribe audio using OpenAI's Whisper model.
 
     Args:
         recording_id: Optional RingCentral recording ID
         url: Optional direct URL to audio file
+        force: Skip the stored result and transcribe the recording again
 
     Returns:
         TranscriptionResult containing the transcription and related metadata
@@ -130,11 +416,21 @@ async def transcribe(recording_id: Optional[str] = None, url: Optional[str] = No
     if not recording_id and not url:
         raise ValueError("Either recording_id or url must be provided")
 
+    # Recording URLs are stable per recording, so a repeat request can reuse
+    # the stored result instead of paying for Whisper and the analysis again
+    cache_key = _transcription_cache_key(url) if url and not recording_id else None
+    if cache_key and not force:
+        cached = await _get_cached_transcription(cache_key)
+        if cached is not None:
+            return cached
+
     # Create a temporary file path for the download
     temp_dir = Path(os.environ.get("TEMP_DIR", "/tmp"))
     temp_dir.mkdir(exist_ok=True)
-    temp_file = temp_dir / \
-        f"audio_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp3"
+    # Reserve a unique name so concurrent transcriptions never share a file
+    fd, temp_name = tempfile.mkstemp(prefix="audio_", suffix=".mp3", dir=temp_dir)
+    os.close(fd)
+    temp_file = Path(temp_name)
 
     try:
         # Download the audio file
@@ -145,22 +441,79 @@ async def transcribe(recording_id: Optional[str] = None, url: Optional[str] = No
         )
 
         # Transcribe the audio file
-        result = await _transcribe_file(downloaded_file)
+        result, analyzed = await _transcribe_file(downloaded_file)
+        # A failed analysis falls back to placeholder fields; keep those out of
+        # the cache so the next request for this recording retries it
+        if cache_key and analyzed:
+            await _store_cached_transcription(cache_key, result)
         return result
 
     finally:
-        # Clean up the temporary file
-        if temp_file.exists():
-            try:
-                os.remove(temp_file)
-            except OSError as e:
-                logger.warning(
-                    f"Failed to remove temporary file {temp_file}: {e}")
+        # Clean up the temporary file off the event loop
+        _schedule_temp_file_cleanup(temp_file)
+
+
+def _transcription_cache_key(url: str) -> Optional[str]:
+    """Return the asr_cache key for a recording URL, or None for local files."""
+    if url.startswith("file://"):
+        return None
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def _get_cached_transcription(cache_key: str) -> Optional[TranscriptionResult]:
+    """Look up a previously stored transcription for this recording."""
+    if db.database is None:
+        return None
+    try:
+        cached = await db.get_collection("asr_cache").find_one({"_id": cache_key}, {"result": 1})
+    except Exception as e:
+        logger.warning(f"ASR cache lookup failed: {e}")
+        return None
+    if not cached:
+        return None
+    logger.info(f"Using cached transcription {cache_key}")
+    return TranscriptionResult.model_validate(cached["result"])
+
+
+async def _store_cached_transcription(cache_key: str, result: TranscriptionResult) -> None:
+    """Store a transcription; the createdAt TTL index expires it after ASR_CACHE_TTL_HOURS."""
+    if db.database is None:
+        return
+    try:
+        # Dump by field name: call_summary and summary share a serialization alias
+        await db.get_collection("asr_cache").replace_one(
+            {"_id": cache_key},
+            {"result": result.model_dump(by_alias=False), "createdAt": datetime.now(timezone.utc)},
+            upsert=True,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to cache transcription {cache_key}: {e}")
 
-async def _transcribe_file(file_path: Path) -> TranscriptionResult:
+
+def _remove_temp_file(path: Path) -> None:
+    """Delete a temporary file, ignoring files that were never written."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to remove temporary file {path}: {e}")
+
+
+def _schedule_temp_file_cleanup(path: Path) -> None:
+    """Fire-and-forget removal of a temporary file in a worker thread."""
+    task = asyncio.create_task(asyncio.to_thread(_remove_temp_file, path))
+    # Keep a strong reference until the task finishes so it is not garbage collected
+    _cleanup_tasks.add(task)
+    task.add_done_callback(_cleanup_tasks.discard)
+
+async def _transcribe_file(file_path: Path) -> Tuple[TranscriptionResult, bool]:
     """
     Transcribe an audio file using local Whisper or Azure Whisper.
     Automatically selects based on USE_LOCAL_WHISPER setting.
+
+    Returns the result together with whether the call analysis completed
+    (or was intentionally skipped for a too-short transcript).
     """
     
     # Choose transcription method based on configuration
@@ -169,41 +522,44 @@ async def _transcribe_file(file_path: Path) -> TranscriptionResult:
         transcript_data = await _transcribe_with_local_whisper(file_path)
     else:
         logger.info("Using AZURE Whisper (with rate limiting)")
-        # Acquire rate limit permission before making the API call
-        await whisper_rate_limiter.acquire()
+        # Pacing happens in _create_whisper_transcription, driven by the deployment's headers
         transcript_data = await _transcribe_with_azure_whisper(file_path)
     
     # Extract text and segments
     text = transcript_data.get("text", "")
     segments = transcript_data.get("segments", [])
-    duration = transcript_data.get("duration", 0)
+    duration = transcript_data.get("duration") or 0
     
-    # Create structured transcript from segments
-    structured_transcript = await _generate_structured_transcript(text, segments)
+    # Create structured transcript from segments, along with the prompt lines
+    # for the analysis built in the same pass
+    structured_transcript, conversation_lines = _generate_structured_transcript(text, segments)
     
-    # Analyze the transcript
-    analysis = await _analyze_transcript(text, structured_transcript)
+    # Analyze the transcript, skipping the LLM round trip for missed calls,
+    # voicemail greetings and line noise that leave next to no speech
+    if _is_too_short_to_analyze(text, duration):
+        logger.info(
+            "Transcript too short to analyze (%d chars, %.1fs); skipping analysis",
+            len(text.strip()),
+            duration,
+        )
+        analysis = {"summary": "Call too short to analyze", "call_type": "unknown"}
+        analyzed = True
+    else:
+        analysis = await _analyze_transcript(text, conversation_lines)
+        # _analyze_transcript returns an empty dict on every failure
+        analyzed = bool(analysis)
     
-    # Generate transcript ID
-    transcript_id = f"transcription_{datetime.now().strftime('%Y%m%d%H%M%S')}_{hash(text) % 10000}"
+    # Generate transcript ID from a stable content hash (builtin hash() is salted per process)
+    text_hash = hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+    transcript_id = f"transcription_{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}_{text_hash}"
     
     # Prepare vehicle tags
     vehicle_tags_dict = _format_vehicle_tags(text, analysis.get("tags", []))
     
     # Extract contact info
-    contacts_dict = analysis.get("contacts") or {}
-    from .schemas import ContactExtraction
-    
-    contact_extraction = ContactExtraction(
-        name=contacts_dict.get("name"),
-        email=contacts_dict.get("email"),
-        phone=contacts_dict.get("phone"),
-        company=contacts_dict.get("company"),
-        address=contacts_dict.get("address"),
-        city=contacts_dict.get("city")
-    )
+    contact_extraction = ContactExtraction.model_validate(analysis.get("contacts") or {})
         
-    return TranscriptionResult(
+    result = TranscriptionResult(
         status="completed",
         text=text,
         confidence=None,
@@ -225,6 +581,14 @@ async def _transcribe_file(file_path: Path) -> TranscriptionResult:
         contact_extraction=contact_extraction,
         audio_duration=duration
     )
+    return result, analyzed
+
+def _is_too_short_to_analyze(text: str, duration: float) -> bool:
+    """Return True when a transcript carries too little speech to be worth analyzing."""
+    if len(text.strip()) < settings.ANALYSIS_MIN_CHARS:
+        return True
+    # Local Whisper does not report a duration, so only trust a positive value
+    return 0 < duration < settings.ANALYSIS_MIN_DURATION_SECONDS
 
 def get_color_for_tag(tag: str) -> str:
     """Derive a deterministic, repeatable color for a given tag."""
@@ -237,6 +601,12 @@ def get_color_for_tag(tag: str) -> str:
     return colors[digest[0] % len(colors)]
 
 
+@lru_cache(maxsize=512)
+def _tag_pattern(lowered_tag: str) -> "re.Pattern[str]":
+    """Compile the whole-word matcher for a tag; tag vocabularies repeat across calls."""
+    return re.compile(r"(?<!\w){}(?!\w)".format(re.escape(lowered_tag)))
+
+
 def _format_vehicle_tags(transcript_text: str, raw_tags: Optional[Sequence[Any]]) -> List[Dict[str, Any]]:
     """Normalize raw tag output into structured metadata with counts and colors."""
     if not raw_tags:
@@ -269,21 +639,17 @@ def _format_vehicle_tags(transcript_text: str, raw_tags: Optional[Sequence[Any]]
         return []
 
     # Preserve first occurrence order while deduplicating (case-insensitive)
-    seen: set[str] = set()
-    unique_tags: List[str] = []
+    unique_tags: Dict[str, str] = {}
     for tag in tag_order:
-        lowered = tag.lower()
-        if lowered in seen:
-            continue
-        seen.add(lowered)
-        unique_tags.append(tag)
+        unique_tags.setdefault(tag.lower(), tag)
 
     formatted_tags: List[Dict[str, Any]] = []
-    for tag in unique_tags:
-        lowered = tag.lower()
-        # Count literal occurrences in transcript text
-        pattern = r"(?<!\w){}(?!\w)".format(re.escape(lowered))
-        count = len(re.findall(pattern, safe_transcript))
+    for lowered, tag in unique_tags.items():
+        # Count literal occurrences in transcript text; the substring check
+        # skips the regex scan for tags the transcript never mentions
+        count = 0
+        if lowered in safe_transcript:
+            count = len(_tag_pattern(lowered).findall(safe_transcript))
         if count == 0:
             count = fallback_counts.get(lowered, 0)
         if count == 0:
@@ -301,13 +667,160 @@ def _format_vehicle_tags(transcript_text: str, raw_tags: Optional[Sequence[Any]]
     return formatted_tags
 
 
-async def _analyze_transcript(text: str, structured_transcript: List[Dict[str, Any]]) -> Dict[str, Any]:
+# Prompt labels for the speakers _generate_structured_transcript assigns
+_SPEAKER_LABELS = {"agent": "AGENT", "customer": "CUSTOMER"}
+
+
+def _build_conversation(lines: List[str]) -> str:
+    """
+    Join "SPEAKER: message" lines into the prompt conversation.
+
+    Very long calls keep their opening and closing turns and drop the middle,
+    since prompt cost grows with every input token.
+    """
+    conversation = "\n".join(lines)
+    max_chars = settings.ANALYSIS_MAX_TRANSCRIPT_CHARS
+    if max_chars <= 0 or len(conversation) <= max_chars:
+        return conversation
+
+    budget = max_chars // 2
+    head: List[str] = []
+    used = 0
+    for line in lines:
+        if used + len(line) + 1 > budget:
+            break
+        head.append(line)
+        used += len(line) + 1
+    head_end = len(head)
+
+    # Cut the first turn that does not fit rather than dropping it, so a single
+    # long turn (e.g. a transcript without segments) still reaches the prompt
+    head_cut = ""
+    if head_end < len(lines) and budget - used > 1:
+        head_cut = lines[head_end][:budget - used - 1]
+
+    tail: List[str] = []
+    used = 0
+    tail_start = len(lines)
+    for line in reversed(lines[head_end:]):
+        if used + len(line) + 1 > budget:
+            break
+        tail.append(line)
+        used += len(line) + 1
+        tail_start -= 1
+    tail.reverse()
+
+    tail_cut = ""
+    if tail_start > head_end and budget - used > 1:
+        tail_cut = lines[tail_start - 1][-(budget - used - 1):]
+    elif tail_start == head_end:
+        # The tail already carries the turn the head was cut from
+        head_cut = ""
+
+    partial_turns = set()
+    if head_cut:
+        head.append(head_cut)
+        partial_turns.add(head_end)
+    if tail_cut:
+        tail.insert(0, tail_cut)
+        partial_turns.add(tail_start - 1)
+    if not head and not tail:
+        return conversation[:max_chars]
+
+    omitted = tail_start - head_end - len(partial_turns)
+    marker = f"[... {omitted} turns omitted ...]" if omitted else "[... transcript truncated ...]"
+    logger.info(f"Transcript truncated for analysis: {omitted} of {len(lines)} turns omitted")
+    return "\n".join([*head, marker, *tail])
+
+
+def _analysis_cache_key(prompt: str) -> str:
+    """Key a call analysis by everything that determines the model's response."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (
+        _CALL_ANALYSIS_MODEL,
+        _CALL_ANALYSIS_SYSTEM_PROMPT,
+        _CALL_ANALYSIS_RESPONSE_FORMAT_JSON,
+        prompt,
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def _remember_analysis(cache_key: str, content: str) -> None:
+    """Keep an analysis in the in-process cache, evicting the least recently used."""
+    expires_at = time.monotonic() + settings.ANALYSIS_CACHE_TTL_DAYS * 86400
+    _analysis_memory_cache[cache_key] = (expires_at, content)
+    _analysis_memory_cache.move_to_end(cache_key)
+    while len(_analysis_memory_cache) > _ANALYSIS_MEMORY_CACHE_SIZE:
+        _analysis_memory_cache.popitem(last=False)
+
+
+async def _get_cached_analysis(cache_key: str) -> Optional[str]:
+    """Return the stored analysis JSON for this prompt, if any."""
+    entry = _analysis_memory_cache.get(cache_key)
+    if entry is not None:
+        expires_at, content = entry
+        if expires_at > time.monotonic():
+            _analysis_memory_cache.move_to_end(cache_key)
+            return content
+        del _analysis_memory_cache[cache_key]
+
+    if db.database is None:
+        return None
+    try:
+        cached = await db.get_collection("analysis_cache").find_one({"_id": cache_key}, {"content": 1})
+    except Exception as e:
+        logger.warning(f"Analysis cache lookup failed: {e}")
+        return None
+    content = cached.get("content") if cached else None
+    if content is not None:
+        _remember_analysis(cache_key, content)
+    return content
+
+
+async def _store_cached_analysis(cache_key: str, content: str) -> None:
+    """Store analysis JSON; the createdAt TTL index expires it after ANALYSIS_CACHE_TTL_DAYS."""
+    _remember_analysis(cache_key, content)
+    if db.database is None:
+        return
+    try:
+        await db.get_collection("analysis_cache").replace_one(
+            {"_id": cache_key},
+            {"content": content, "createdAt": datetime.now(timezone.utc)},
+            upsert=True,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to cache analysis {cache_key}: {e}")
+
+
+@_openai_retry
+async def _create_call_analysis(client: AsyncAzureOpenAI, prompt: str) -> ChatCompletion:
+    """Request the structured call analysis, paced by the deployment's reported quota."""
+    # Roughly 4 characters per token
+    async with azure_openai_rate_limiter.reserve(estimated_tokens=len(prompt) // 4) as limiter:
+        raw_completion = await client.chat.completions.with_raw_response.create(
+            model=_CALL_ANALYSIS_MODEL,
+            messages=[
+                {
+                "role": "system",
+                "content": _CALL_ANALYSIS_SYSTEM_PROMPT
+                },
+                {"role": "user", "content": prompt}
+            ],
+            response_format=_CALL_ANALYSIS_RESPONSE_FORMAT
+        )
+        limiter.update_from_headers(raw_completion.headers)
+    return raw_completion.parse()
+
+
+async def _analyze_transcript(text: str, conversation_lines: List[str]) -> Dict[str, Any]:
     """
     Analyze transcript to extract keywords, generate summaries, and other insights.
 
     Args:
         text: Full transcript text
-        structured_transcript: Structured transcript with speaker turns
+        conversation_lines: "SPEAKER: message" lines from _generate_structured_transcript
 
     Returns:
         Dictionary with analysis results
@@ -315,150 +828,39 @@ async def _analyze_transcript(text: str, structured_transcript: List[Dict[str, A
     if not text.strip():
         return {}
 
-    # Initialize with default values
-    call_analysis_schema = {
-        "type": "object",
-        "properties": {
-            "keywords": {
-                "type": "array",
-                "items": {
-                    "type": "string"
-                },
-                "minItems": 0
-            },
-            "summary": {
-                "type": ["string", "null"]
-            },
-            "tags": {
-                "type": "array",
-                "items": {
-                    "type": "string"
-                },
-                "description": "Vehicle-related terms (makes, models, types) as clean strings without frequency counts, Eg: {'ford': '8'},'{transit custom': '8'}}"
-            },
-            "sentiment": {
-                "type": ["number", "null"]
-            },
-            "mql_score": {
-                "type": ["number", "null"]
-            },
-            "rating": {
-                "type": ["number", "null"]
-            },
-            "call_type": {
-                "type": ["string", "null"]
-            },
-            "buyer_intent_score": {
-                "type": ["number", "null"]
-            },
-            "buyer_intent_reason": {
-                "type": ["string", "null"]
-            },
-            "agent_recommendation": {
-                "type": ["string", "null"]
-            },
-            "analysis": {
-                "type": ["string", "null"]
-            },
-            "contacts": {
-                "type": "object",
-                "properties": {
-                    "name": {
-                        "type": ["string", "null"]
-                    },
-                    "email": {
-                        "type": ["string", "null"],
-                        "format": "email"
-                    },
-                    "phone": {
-                        "type": ["string", "null"]
-                    },
-                    "company": {
-                        "type": ["string", "null"]
-                    },
-                    "address": {
-                        "type": ["string", "null"]
-                    },
-                    "city": {
-                        "type": ["string", "null"]
-                    }
-                },
-                "required": ["name", "email", "phone", "company", "address", "city"],
-                "additionalProperties": False
-            }
-        },
-        "required": ["keywords", "summary", "tags", "sentiment", "mql_score", "rating", "call_type", "buyer_intent_score", "buyer_intent_reason", "agent_recommendation", "analysis", "contacts"],
-        "additionalProperties": False
-    }
-
     # Use OpenAI to analyze the transcript
     try:
-        client = get_azure_openai_client()
-
         # Build prompt with structured format
-        conversation = "\n".join([
-            f"{turn['speaker'].upper()}: {turn['message']}"
-            for turn in structured_transcript
-        ])
+        conversation = _build_conversation(conversation_lines)
 
         # Compose a comprehensive prompt for the LLM, integrating granular sub-prompts for each analysis field.
-        prompt = f"""
-    Analyze this Vanaways sales call transcript and extract the required information.
+        prompt = _CALL_ANALYSIS_PROMPT_TEMPLATE.format(conversation=conversation)
 
-    Transcript:
-    {conversation}
+        # Identical prompts (re-runs, duplicate deliveries) reuse the stored response
+        cache_key = _analysis_cache_key(prompt)
+        content = await _get_cached_analysis(cache_key)
+        cached = content is not None
 
-    For each of the following, analyze the transcript and provide the result in the specified format:
-
-    - keywords: Extract the most important keywords and phrases from this van-related conversation. Focus on vehicle types, models, makes, leasing/sales terms, business needs, and action items. Return only a JSON array of strings, e.g. ["keyword1", "keyword2", "keyword3"].
-    - mql_assessment: Score this van-related conversation as a Marketing Qualified Lead (MQL) from 0 to 10. Consider: interest level, budget signals, authority to decide, urgency, and product fit. Return only the number.
-    - sentiment_analysis: Rate the overall sentiment of this van-related customer conversation from 0 (very negative) to 10 (very positive). Consider satisfaction, tone, agent helpfulness, issue resolution, and engagement. Return only the number.
-    - customer_rating: Based on this van-related conversation, rate how satisfied the customer seems. Scale: 0 = very unhappy, 5-6 = neutral, 9-10 = very happy. Return only the number.
-    - call_type: Classify this van-related conversation into one of: "High Score", "Hot Lead", "Customer Issue", "General Inquiry", "Follow Up", "Other". Return only the category name.
-    - summary: Provide a concise one-line summary of this van-related conversation (max 100 characters). Example: "Customer needs leasing for 5 Ford Transit vans, asks for pricing this month".
-    - vehicle_tags: Extract all vehicle-related terms from this conversation (makes, models, types). Count frequency of each term. Return only valid JSON. Example: {{"ford": "2", "transit": "3", "van": "5"}}. If none, return {{}}.
-    - contact_extraction: From this van-related conversation, extract ONLY the CUSTOMER's name (first name is fine if full name not given) and email address if present. Ignore any names that are followed by 'from Vanaways' or similar, since those are Agents. Correct any 'Banaways' typos to 'Vanaways'. Return ONLY JSON in this exact format: {{"name":"<name or empty>","email":"<email or empty>"}}.
-    - Purchase intent signals and next steps: Make sure buyer_intent_score is only calculated from clear purchase intent signals (If call is being to sales call then analyze for intent, otherwise return 0), same for buyer_intent_reason if not then empty string.
-    - agent_recommendation: Based on this van-related conversation, suggest the best next action for the sales agent.
-    - Provide a detailed analysis of the call, including strengths and weaknesses of the sales approach.
-
-    NOTE: If the transcript is empty or lacks meaningful content, respond with null, empty lists, or 0 for all fields as appropriate.
-
-    Provide a complete analysis with insights that would help Vanaways improve their sales process.
-    """
-
-        # Generate analysis using GPT with structured output
-        completion = await asyncio.to_thread(
-            lambda: client.chat.completions.create(
-            model="gpt-4.1",
-            messages=[
-                {
-                "role": "system",
-                "content": (
-                    "You are an assistant that analyzes van-related customer conversations of Vanaways."
-                    "Provide concise, accurate, and structured insights based on the transcript."
-                    "Analyze properly and do not make up information."
-                )
-                },
-                {"role": "user", "content": prompt}
-            ],
-            response_format={
-                "type": "json_schema",
-                "json_schema": {
-                "name": "call_analysis",
-                "schema": call_analysis_schema,
-                "strict": True
-                }
-            }
-            )
-        )
+        if not cached:
+            # Generate analysis using GPT with structured output
+            client = get_async_azure_openai_client()
+            completion = await _create_call_analysis(client, prompt)
+            content = completion.choices[0].message.content
 
         # Parse response
-        content = completion.choices[0].message.content
-        result = json.loads(content)
+        if not content:
+            logger.warning("Transcript analysis returned no content")
+            return {}
+        try:
+            result = orjson.loads(content)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Transcript analysis returned invalid JSON ({len(content)} chars): {e}")
+            return {}
+
+        if not cached:
+            await _store_cached_analysis(cache_key, content)
 
-        # Debug output of the parsed result
-        print("\n\nANALYSIS RESULT", result)
+        logger.debug("Analysis result: %s", result)
 
         return result
     except Exception as e:
@@ -471,30 +873,44 @@ def _extract_segments(transcript: Any) -> List[Dict[str, Any]]:
     segments: List[Dict[str, Any]] = []
 
     if isinstance(raw_segments, list):
+        # Bound once; this runs for every Whisper segment of the call
+        append = segments.append
         for seg in raw_segments:
             if isinstance(seg, dict):
-                start = seg.get("start")
-                end = seg.get("end")
-                text = seg.get("text")
+                seg_get = seg.get
+                text = seg_get("text")
+                if text is None:
+                    continue
+                start = seg_get("start")
+                end = seg_get("end")
             else:
+                text = getattr(seg, "text", None)
+                if text is None:
+                    continue
                 start = getattr(seg, "start", None)
                 end = getattr(seg, "end", None)
-                text = getattr(seg, "text", None)
-
-            if text is None:
-                continue
 
             segment_entry: Dict[str, Any] = {"text": str(text)}
             if isinstance(start, (int, float)):
                 segment_entry["start"] = float(start)
             if isinstance(end, (int, float)):
                 segment_entry["end"] = float(end)
-            segments.append(segment_entry)
+            append(segment_entry)
 
     return segments
 
 
-async def _generate_structured_transcript(text: str, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+# Phrases that strongly suggest who is speaking in a transcript segment,
+# compiled into one alternation each so a segment is scanned in a single pass
+_AGENT_MARKERS = ("hi, this is", "speaking", "how can i help", "vanaways", "i'm from")
+_CUSTOMER_MARKERS = ("i'm looking", "i want", "i need", "call about", "interested in")
+_AGENT_MARKER_RE = re.compile("|".join(map(re.escape, _AGENT_MARKERS)), re.IGNORECASE)
+_CUSTOMER_MARKER_RE = re.compile("|".join(map(re.escape, _CUSTOMER_MARKERS)), re.IGNORECASE)
+
+
+def _generate_structured_transcript(
+    text: str, segments: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[str]]:
     """
     Generate a structured transcript from text and segments.
 
@@ -503,35 +919,32 @@ async def _generate_structured_transcript(text: str, segments: List[Dict[str, An
         segments: List of segment dictionaries with text, start, and end
 
     Returns:
-        List of structured transcript entries
+        Tuple of the structured transcript entries and the matching
+        "SPEAKER: message" prompt lines (turns without text are left out)
     """
-    if not text.strip():
-        return []
+    stripped_text = text.strip()
+    if not stripped_text:
+        return [], []
 
     structured: List[Dict[str, Any]] = []
+    conversation_lines: List[str] = []
 
     # Create structured transcript from segments
     current_speaker = "agent"  # Start with agent as default
 
     for idx, segment in enumerate(segments):
         # More sophisticated speaker detection using text content
-        text_content = segment.get("text", "").strip().lower()
-
-        # Check for speaker indicators in text
-        is_agent = any(x in text_content for x in [
-                       "hi, this is", "speaking", "how can i help", "vanaways", "i'm from"])
-        is_customer = any(x in text_content for x in [
-                          "i'm looking", "i want", "i need", "call about", "interested in"])
+        text_content = segment.get("text") or ""
 
         # Only change speaker if there's a strong indicator
-        if is_agent:
+        if _AGENT_MARKER_RE.search(text_content):
             current_speaker = "agent"
-        elif is_customer:
+        elif _CUSTOMER_MARKER_RE.search(text_content):
             current_speaker = "customer"
-        elif idx > 0 and len(structured) > 0:
-            # Alternate speakers for normal conversation flow if no clear indicators
-            prev_speaker = structured[-1]["speaker"]
-            current_speaker = "customer" if prev_speaker == "agent" else "agent"
+        elif idx > 0:
+            # Alternate speakers for normal conversation flow if no clear indicators;
+            # current_speaker still holds the previous segment's speaker
+            current_speaker = "customer" if current_speaker == "agent" else "agent"
 
         # Format timestamp as string dictionary for compatibility with TranscriptUtterance schema
         start_time = segment.get("start")
@@ -543,19 +956,23 @@ async def _generate_structured_transcript(text: str, segments: List[Dict[str, An
 
         structured.append({
             "speaker": current_speaker,
-            "message": segment.get("text", ""),
+            "message": text_content,
             "timestamp": timestamp,
         })
+        message = text_content.strip()
+        if message:
+            conversation_lines.append(f"{_SPEAKER_LABELS[current_speaker]}: {message}")
 
     # If no segments, create from full text
-    if not structured and text.strip():
+    if not structured:
         structured.append({
             "speaker": "agent",  # Default speaker for single-entry transcript
-            "message": text.strip(),
+            "message": stripped_text,
             "timestamp": {"start": "0", "end": ""},
         })
+        conversation_lines.append(f"{_SPEAKER_LABELS['agent']}: {stripped_text}")
 
-    return structured
+    return structured, conversation_lines
 
 async def _transcribe_with_local_whisper(file_path: Path) -> Dict[str, Any]:
     """Transcribe using local Whisper model."""
@@ -571,25 +988,32 @@ async def _transcribe_with_local_whisper(file_path: Path) -> Dict[str, Any]:
         raise
 
 
-async def _transcribe_with_azure_whisper(file_path: Path) -> Dict[str, Any]:
-    """Transcribe using Azure OpenAI Whisper API."""
-    client = get_azure_openai_whisper_client()
-    model = "whisper"
-    
-    def _transcribe():
+@_openai_retry
+async def _create_whisper_transcription(client: AsyncAzureOpenAI, file_path: Path) -> Any:
+    """Upload a recording to the Azure Whisper deployment."""
+    # Whisper quota is request based, so no token estimate is reserved.
+    # A file handle is streamed into the multipart body chunk by chunk, whereas a
+    # Path would be read into memory whole; it is reopened on every retry attempt.
+    async with azure_openai_whisper_rate_limiter.reserve() as limiter:
         with open(file_path, "rb") as file_stream:
-            return client.audio.transcriptions.create(
-                model=model,
+            raw_transcript = await client.audio.transcriptions.with_raw_response.create(
+                model="whisper",
                 file=file_stream,
                 response_format="verbose_json",
-                timestamp_granularities=["word", "segment"],
+                timestamp_granularities=["segment"],
                 prompt=(
                     "This is a sales call recording between a customer and a sales agent from Vanaways. "
                     "Please accurately identify and separate the speakers throughout the conversation."
                 )
             )
-    
-    transcript = await asyncio.to_thread(_transcribe)
+        limiter.update_from_headers(raw_transcript.headers)
+    return raw_transcript.parse()
+
+
+async def _transcribe_with_azure_whisper(file_path: Path) -> Dict[str, Any]:
+    """Transcribe using Azure OpenAI Whisper API."""
+    client = get_async_azure_openai_whisper_client()
+    transcript = await _create_whisper_transcription(client, Path(file_path))
     
     # Convert Azure response to standard format
     return {
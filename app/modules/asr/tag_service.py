@@ -2,12 +2,19 @@ import logging
 from typing import Any, Dict, List, Optional, Sequence
 
 from bson import ObjectId
+from pymongo import UpdateOne
 
 from app.core.database.mongodb import db
 from .service import _format_vehicle_tags
 
 logger = logging.getLogger(__name__)
 
+# Only the fields the tag formatting reads from a call document
+_TAG_SOURCE_PROJECTION = {"tags": 1, "transcription": 1, "transcriptionResult.text": 1, "summary": 1}
+
+# Calls fetched per cursor batch and updated per bulk write in update_call_tags_bulk
+_TAG_BULK_BATCH_SIZE = 500
+
 
 async def update_call_tags(
     call_id: Optional[str] = None,
@@ -48,23 +55,12 @@ async def update_call_tags(
 
     try:
         calls_collection = db.get_collection("calls")
-        call_document = await calls_collection.find_one(query)
+        call_document = await calls_collection.find_one(query, _TAG_SOURCE_PROJECTION)
         if not call_document:
             logger.warning("Call not found for query: %s", query)
             return None
 
-        existing_tags = call_document.get("tags")
-        raw_tags = _coerce_raw_tags(existing_tags)
-        if not raw_tags and not existing_tags:
-            logger.info("Call %s has no tags to update.", call_document.get("_id"))
-            await calls_collection.update_one(
-                {"_id": call_document["_id"]}, {"$set": {"tags": []}}
-            )
-            return []
-
-        transcript_text = _build_transcript_text(call_document)
-        formatted_tags = _format_vehicle_tags(transcript_text, raw_tags)
-
+        formatted_tags = _reformat_tags(call_document)
         await calls_collection.update_one(
             {"_id": call_document["_id"]},
             {"$set": {"tags": formatted_tags}},
@@ -80,6 +76,75 @@ async def update_call_tags(
             await db.disconnect()
 
 
+async def update_call_tags_bulk(call_ids: Sequence[str]) -> int:
+    """
+    Update the `tags` field of many calls to the structured format.
+
+    Calls are read through one cursor and written back with unordered bulk
+    writes, instead of a find_one and update_one round trip per call.
+
+    Args:
+        call_ids: MongoDB _id values of the calls as strings.
+
+    Returns:
+        The number of call documents matched by the updates.
+
+    Raises:
+        ValueError: If any call_id is malformed.
+    """
+    object_ids: List[ObjectId] = []
+    for call_id in call_ids:
+        try:
+            object_ids.append(ObjectId(call_id))
+        except Exception as exc:
+            raise ValueError(f"Invalid call_id supplied: {call_id}") from exc
+    if not object_ids:
+        return 0
+
+    disconnect_after = False
+    if db.database is None:
+        await db.connect()
+        disconnect_after = True
+
+    try:
+        calls_collection = db.get_collection("calls")
+        cursor = calls_collection.find(
+            {"_id": {"$in": object_ids}},
+            _TAG_SOURCE_PROJECTION,
+            batch_size=_TAG_BULK_BATCH_SIZE,
+        )
+
+        matched = 0
+        operations: List[UpdateOne] = []
+        async for call_document in cursor:
+            operations.append(
+                UpdateOne({"_id": call_document["_id"]}, {"$set": {"tags": _reformat_tags(call_document)}})
+            )
+            if len(operations) >= _TAG_BULK_BATCH_SIZE:
+                result = await calls_collection.bulk_write(operations, ordered=False)
+                matched += result.matched_count
+                operations = []
+
+        if operations:
+            result = await calls_collection.bulk_write(operations, ordered=False)
+            matched += result.matched_count
+
+        logger.info("Updated tags for %d of %d requested calls.", matched, len(object_ids))
+        return matched
+    finally:
+        if disconnect_after:
+            await db.disconnect()
+
+
+def _reformat_tags(call_document: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return the structured tags for a call document, or [] when it has none."""
+    existing_tags = call_document.get("tags")
+    raw_tags = _coerce_raw_tags(existing_tags)
+    if not raw_tags and not existing_tags:
+        return []
+    return _format_vehicle_tags(_build_transcript_text(call_document), raw_tags)
+
+
 def _coerce_raw_tags(tags: Any) -> Sequence[Any]:
     """Translate stored tag structures into the raw format expected by _format_vehicle_tags."""
     if not tags:
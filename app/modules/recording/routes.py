@@ -1,20 +1,25 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
 from .schemas import DownloadRequest
-from .service import fetch_recording_bytes
+from .service import stream_recording
 
 
 router = APIRouter()
 
 
 @router.post("/download", response_class=StreamingResponse, summary="Download a RingCentral audio file by content URL")
-def download_recording(body: DownloadRequest):
+async def download_recording(body: DownloadRequest):
     try:
-        data, content_type, filename = fetch_recording_bytes(str(body.content_url), body.filename)
+        chunks, content_type, filename, release = await stream_recording(str(body.content_url), body.filename)
 
         headers = {"Content-Disposition": f"attachment; filename={filename}"}
-        return StreamingResponse(iter([data]), media_type=content_type, headers=headers)
+        # Relay the upstream body chunk by chunk instead of holding the whole recording;
+        # the background task frees the upstream connection even if the body is never read
+        return StreamingResponse(
+            chunks, media_type=content_type, headers=headers, background=BackgroundTask(release)
+        )
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to download recording: {e}")
 
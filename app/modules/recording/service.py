@@ -1,26 +1,21 @@
-import json
+import asyncio
 import logging
-import re
 import time
-import random
-import threading
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from email.message import Message
+from email.utils import collapse_rfc2231_value
+from typing import AsyncIterator, Callable, Optional, Tuple
+from urllib.parse import unquote, urlsplit
 
-import requests
-from requests import HTTPError
-
-from app.core.config import settings
 from app.ringcentral.client import get_platform
+from app.ringcentral.service import DOWNLOAD_CHUNK_SIZE, get_http_session
 
 
 logger = logging.getLogger(__name__)
 
-# Module-level soft throttle shared within process
+# Module-level soft throttle shared within process (time.monotonic() deadline);
+# only touched from the event loop, so it needs no lock
 _rc_next_allowed_at: float = 0.0
-_rc_token_lock = threading.Lock()
-_rc_cached_direct_token: Optional[str] = None
-_rc_cached_direct_token_expiry: Optional[float] = None  # epoch seconds
 
 
 @dataclass
@@ -36,28 +31,76 @@ def _derive_filename_from_headers(url: str, content_disposition: Optional[str],
         return fallback
 
     if content_disposition:
-        match = re.search(r'filename\*=UTF-8\'\'([^;]+)|filename="?([^";]+)"?', content_disposition)
-        if match:
-            return requests.utils.unquote(match.group(1) or match.group(2))
+        # email.message handles quoted strings and RFC 2231 filename*=UTF-8'' parameters
+        header = Message()
+        header["content-disposition"] = content_disposition
+        values = [
+            value
+            for key, value in header.get_params(header="content-disposition") or []
+            if key == "filename"
+        ]
+        # Prefer the extended filename*= form, which arrives already decoded;
+        # plain filename= values may still carry percent-escapes
+        extended = next((value for value in values if isinstance(value, tuple)), None)
+        if extended:
+            header_filename = collapse_rfc2231_value(extended)
+        elif values:
+            header_filename = unquote(values[0])
+        else:
+            header_filename = ""
+        if header_filename:
+            return header_filename
 
-    # Fallback: take last part of URL path
-    path_part = url.split("?")[0].rstrip("/")
-    candidate = path_part.split("/")[-1] or "recording"
+    # Fallback: take last part of URL path (urlsplit also drops the query and fragment)
+    path_part = urlsplit(url).path.rstrip("/")
+    candidate = path_part.rsplit("/", 1)[-1] or "recording"
     if "." not in candidate:
         candidate += ".mp3"
     return candidate
 
 
-def fetch_recording_bytes(content_url: str, filename: Optional[str] = None) -> Tuple[bytes, str, str]:
+async def stream_recording(
+    content_url: str, filename: Optional[str] = None
+) -> Tuple[AsyncIterator[bytes], str, str, Callable[[], None]]:
     """
-    Download a RingCentral recording given a content URL.
-    Returns: (data_bytes, content_type, resolved_filename)
+    Open a RingCentral recording given a content URL without buffering it.
+    Returns: (chunk_iterator, content_type, resolved_filename, release)
+
+    The iterator releases the connection once exhausted; call ``release`` when
+    it may never be consumed (e.g. the client disconnects first).
     """
+    global _rc_next_allowed_at
+    # Fail fast while RingCentral's last 429 is still in effect instead of spending another request
+    wait_s = _rc_next_allowed_at - time.monotonic()
+    if wait_s > 0:
+        raise RingCentralRateLimitActive(retry_after=wait_s)
+
+    # A token refresh inside get_platform() is a blocking requests call
+    platform = await asyncio.to_thread(get_platform)
+    session = get_http_session()
+    response = await session.get(content_url, headers=platform["headers"])
     try:
-        platform = get_platform()
-        api_response = platform.get(content_url)
-        return api_response.response()
+        if response.status == 429:
+            retry_after = float(response.headers.get("Retry-After", 0) or 30)
+            _rc_next_allowed_at = max(_rc_next_allowed_at, time.monotonic() + retry_after)
+            raise RingCentralRateLimitActive(retry_after=retry_after)
+        if response.status != 200:
+            raise Exception(f"Failed to fetch recording: HTTP {response.status}")
+
+        content_type = response.headers.get("Content-Type", "audio/mpeg")
+        resolved_filename = _derive_filename_from_headers(
+            content_url, response.headers.get("Content-Disposition"), filename
+        )
     except Exception as e:
+        response.release()
         logger.error(f"Failed to fetch recording from {content_url}: {e}")
         raise
-        
+
+    async def _iter_chunks() -> AsyncIterator[bytes]:
+        try:
+            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                yield chunk
+        finally:
+            response.release()
+
+    return _iter_chunks(), content_type, resolved_filename, response.release
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional, Tuple
 
 import groq
+import orjson
 
 from app.core.config import settings
-from app.modules.asr.service import TranscriptionResult, transcribe_from_url
+from app.modules.asr.service import TranscriptionResult, transcribe
 from app.modules.transcription import service as transcription_service
 
 logger = logging.getLogger(__name__)
@@ -64,11 +65,11 @@ def _extract_core_fields(payload: Dict[str, Any]) -> Tuple[str, Optional[str], O
     return str(call_id), recording_url, call_transcript, meta
 
 
-def _maybe_transcribe(recording_url: Optional[str]) -> Optional[TranscriptionResult]:
+async def _maybe_transcribe(recording_url: Optional[str]) -> Optional[TranscriptionResult]:
     if not recording_url:
         return None
     try:
-        return transcribe_from_url(recording_url)
+        return await transcribe(url=recording_url)
     except Exception as exc:  # pragma: no cover - propagates to caller with context
         logger.exception("Transcription failed for recording %s", recording_url)
         raise TranscriptionJobError(f"Transcription failed: {exc}", status_code=502) from exc
@@ -84,7 +85,7 @@ def _ensure_transcript_text(
     raise TranscriptionJobError("Transcription text is empty", status_code=502)
 
 
-def process_transcription_job(
+async def process_transcription_job(
     payload: Dict[str, Any],
     *,
     groq_client: Optional[groq.Groq] = None,
@@ -104,14 +105,24 @@ def process_transcription_job(
 
     client = _ensure_groq_client(groq_client)
     call_id, recording_url, transcript_text, meta = _extract_core_fields(payload)
-    transcription = _maybe_transcribe(recording_url)
+    transcription = await _maybe_transcribe(recording_url)
     transcript_text = _ensure_transcript_text(transcript_text, transcription)
 
-    sentiment, sentiment_score = transcription_service.analyze_sentiment(client, transcript_text)
-    rating, rating_explanation = transcription_service.rate_call(client, transcript_text)
-    keywords = transcription_service.extract_keywords(client, transcript_text)
-    client_details = transcription_service.get_client_details(client, transcript_text)
-    formatted_transcript = transcription_service.make_transcription_readable(client, transcript_text)
+    # The five Groq prompts are independent blocking round trips, so run them
+    # side by side in worker threads instead of one after another on the loop
+    (
+        (sentiment, sentiment_score),
+        (rating, rating_explanation),
+        keywords,
+        client_details,
+        formatted_transcript,
+    ) = await asyncio.gather(
+        asyncio.to_thread(transcription_service.analyze_sentiment, client, transcript_text),
+        asyncio.to_thread(transcription_service.rate_call, client, transcript_text),
+        asyncio.to_thread(transcription_service.extract_keywords, client, transcript_text),
+        asyncio.to_thread(transcription_service.get_client_details, client, transcript_text),
+        asyncio.to_thread(transcription_service.make_transcription_readable, client, transcript_text),
+    )
 
     response_payload: Dict[str, Any] = {
         "callId": call_id,
@@ -120,7 +131,7 @@ def process_transcription_job(
         "keywords": keywords,
         "call_rating": rating,
         "rating_explanation": rating_explanation,
-        "buyer_intent": buyer_intent,
+        "buyer_intent": transcription.buyer_intent if transcription else None,
         "buyer_intent_score": transcription.buyer_intent_score if transcription else None,
         "client_email": client_details.get("email", ""),
         "client_name": client_details.get("name", ""),
@@ -162,4 +173,4 @@ def process_transcription_job(
 
 def dump_processed_transcription(result: ProcessedTranscription) -> str:
     """Serialize processed transcription payload as JSON for auditing/logging."""
-    return json.dumps(result.data, ensure_ascii=False, indent=2)
+    return orjson.dumps(result.data, option=orjson.OPT_INDENT_2).decode("utf-8")
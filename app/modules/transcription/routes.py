@@ -89,7 +89,7 @@ def extract_transcription_keywords(
 
 
 @router.post("/process-transcription")
-def process_transcription_job_endpoint(
+async def process_transcription_job_endpoint(
     payload: Dict[str, Any],
     groq_client = Depends(get_groq_client),
     publish_to_kafka: bool = Query(
@@ -98,7 +98,7 @@ def process_transcription_job_endpoint(
 ):
     """Process a transcription job (same structure as async worker messages)."""
     try:
-        processed: ProcessedTranscription = process_transcription_job(
+        processed: ProcessedTranscription = await process_transcription_job(
             payload,
             groq_client=groq_client,
             publish_to_kafka=publish_to_kafka,
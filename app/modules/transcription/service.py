@@ -1,6 +1,6 @@
 from typing import Dict, List, Optional, Tuple
 import groq
-import json
+import orjson
 import re
 import math
 from collections import Counter
@@ -35,6 +35,13 @@ CALL_STOPWORDS = {
     'hmm', 'thank', 'thanks', 'please', 'bye', 'goodbye', 'agent', 'user'
 }
 
+# Stopwords applied by the lightweight keyword extractors
+KEYWORD_STOPWORDS = frozenset(COMMON_STOPWORDS | CALL_STOPWORDS)
+
+# Tokenizer and sentence splitter shared by the keyword extractors
+WORD_PATTERN = re.compile(r'\b[a-zA-Z]{3,}\b')
+SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]\s+')
+
 # Groq-based analysis functions
 def _call_groq_api(groq_client: groq.Groq, system_prompt: str, user_prompt: str, 
                   temperature: float = 0.1, max_tokens: int = 100) -> Optional[dict]:
@@ -51,8 +58,8 @@ def _call_groq_api(groq_client: groq.Groq, system_prompt: str, user_prompt: str,
         )
         
         response_content = response.choices[0].message.content
-        return json.loads(response_content)
-    except json.JSONDecodeError as e:
+        return orjson.loads(response_content)
+    except orjson.JSONDecodeError as e:
         print(f"Error parsing Groq response: {e}")
     except Exception as e:
         print(f"Error calling Groq API: {e}")
@@ -96,7 +103,7 @@ and the communication should be like two and fro
     if result:
         try:
             # Assuming the Groq response is a JSON array of Q&A pairs
-            formatted_transcription = json.dumps(result, indent=2)
+            formatted_transcription = orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
             return formatted_transcription
         except (ValueError, TypeError) as e:
             print(f"Error processing formatted transcription result: {e}")
@@ -242,7 +249,7 @@ def basic_keyword_extraction(content: str) -> Dict[str, int]:
             stop_words = COMMON_STOPWORDS.union(CALL_STOPWORDS)
         
         # Simple tokenization using regex instead of word_tokenize
-        tokens = re.findall(r'\b[a-zA-Z]{3,}\b', content.lower())
+        tokens = WORD_PATTERN.findall(content.lower())
         
         # Remove stopwords
         filtered_tokens = [word for word in tokens if word not in stop_words]
@@ -279,17 +286,17 @@ def tfidf_keyword_extraction(content: str) -> Dict[str, int]:
         Dictionary of keywords with their frequencies
     """
     # Use combined stopwords from constants
-    stop_words = COMMON_STOPWORDS.union(CALL_STOPWORDS)
+    stop_words = KEYWORD_STOPWORDS
     
     # Split content into sentences (simple approach)
-    sentences = re.split(r'[.!?]\s+', content.lower())
+    sentences = SENTENCE_SPLIT_PATTERN.split(content.lower())
     sentences = [s for s in sentences if s.strip()]
     
     # Tokenize each sentence
     tokenized_sentences = []
     for sentence in sentences:
         # Extract words with at least 3 characters
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', sentence)
+        words = WORD_PATTERN.findall(sentence)
         # Filter out stopwords
         filtered_words = [word for word in words if word not in stop_words]
         tokenized_sentences.append(filtered_words)
@@ -349,14 +356,14 @@ def fallback_keyword_extraction(content: str) -> Dict[str, int]:
         Dictionary of keywords with their frequencies (top 20)
     """
     # Use combined stopwords from constants
-    stop_words = COMMON_STOPWORDS.union(CALL_STOPWORDS)
+    stop_words = KEYWORD_STOPWORDS
     
     # Handle empty content
     if not content or not content.strip():
         return {}
     
     # Simple tokenization with regex
-    words = re.findall(r'\b[a-zA-Z]{3,}\b', content.lower())
+    words = WORD_PATTERN.findall(content.lower())
     
     # Filter out stopwords
     filtered_words = [word for word in words if word not in stop_words]
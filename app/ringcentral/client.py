@@ -2,15 +2,16 @@ import os
 import time
 import asyncio
 import random
-from typing import Optional, Dict, Any, Union
-from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, Tuple, Union
 
+import orjson
 from ringcentral import SDK
 from app.core.config import settings
 import base64
 import requests
 import aiohttp
 import urllib.parse
+from requests.adapters import HTTPAdapter
 
 class RingCentralApiError(Exception):
     """Exception raised for RingCentral API errors."""
@@ -23,29 +24,45 @@ class RingCentralApiError(Exception):
 # Add maximum retries constant
 MAX_RETRIES = 3
 
+# Exponential backoff per retry attempt, capped at the last entry
+_BACKOFF_SECONDS = (1.0, 2.0, 4.0, 8.0)
+
+
+def backoff_seconds(retry_count: int) -> float:
+    """Return the jittered wait before retry attempt retry_count + 1."""
+    return _BACKOFF_SECONDS[min(retry_count, len(_BACKOFF_SECONDS) - 1)] + random.random()
+
 
 _platform = None
-_token_cache: Dict[str, Any] = {}
-_token_expiry_time: Optional[datetime] = None
-_refresh_token_expiry_time: Optional[datetime] = None
+
+# Keep-alive session for the OAuth token endpoint so refreshes reuse the TLS connection
+_token_http_session = requests.Session()
+_token_http_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=10, max_retries=0))
+
+# (token_data, access token expiry, refresh token expiry); expiries are
+# time.monotonic() deadlines. Kept as one tuple so a reader never pairs a token
+# with another token's expiry.
+_token_state: Optional[Tuple[Dict[str, Any], Optional[float], Optional[float]]] = None
 
 
 def get_token(force_refresh=False):
     """Get OAuth token from RingCentral platform with caching and auto-refresh."""
-    global _token_cache, _token_expiry_time, _refresh_token_expiry_time
-    
-    current_time = datetime.now()
-    
-    # Check if we have a valid token cache that's not expired and not forced to refresh
-    if not force_refresh and _token_cache and _token_expiry_time and current_time < _token_expiry_time:
-        return _token_cache
+    state = _token_state
     
-    # Check if we can use refresh token
-    if not force_refresh and _token_cache and _refresh_token_expiry_time and current_time < _refresh_token_expiry_time and 'refresh_token' in _token_cache:
-        try:
-            return refresh_token(_token_cache['refresh_token'])
-        except Exception as e:
-            print(f"Refresh token failed: {e}. Falling back to full authentication.")
+    if not force_refresh and state is not None:
+        token_data, token_expiry, refresh_expiry = state
+        current_time = time.monotonic()
+        
+        # Check if we have a valid token cache that's not expired
+        if token_data and token_expiry and current_time < token_expiry:
+            return token_data
+        
+        # Check if we can use refresh token
+        if token_data and refresh_expiry and current_time < refresh_expiry and 'refresh_token' in token_data:
+            try:
+                return refresh_token(token_data['refresh_token'])
+            except Exception as e:
+                print(f"Refresh token failed: {e}. Falling back to full authentication.")
     
     # Full authentication
     auth_string = f"{settings.RINGCENTRAL_CLIENT_ID}:{settings.RINGCENTRAL_CLIENT_SECRET}"
@@ -56,7 +73,7 @@ def get_token(force_refresh=False):
         'assertion': settings.RINGCENTRAL_JWT,
     })
 
-    response = requests.post(
+    response = _token_http_session.post(
         f"{settings.RINGCENTRAL_API_URL}/restapi/oauth/token",
         data=params,
         headers={
@@ -65,9 +82,9 @@ def get_token(force_refresh=False):
         }
     )
     
-    token_data = response.json()
+    token_data = orjson.loads(response.content)
     _update_token_cache(token_data)
-    return _token_cache
+    return token_data
 
 
 def refresh_token(refresh_token_str):
@@ -80,7 +97,7 @@ def refresh_token(refresh_token_str):
         'refresh_token': refresh_token_str,
     })
     
-    response = requests.post(
+    response = _token_http_session.post(
         f"{settings.RINGCENTRAL_API_URL}/restapi/oauth/token",
         data=params,
         headers={
@@ -92,23 +109,29 @@ def refresh_token(refresh_token_str):
     if response.status_code != 200:
         raise Exception(f"Failed to refresh token: {response.text}")
         
-    token_data = response.json()
+    token_data = orjson.loads(response.content)
     _update_token_cache(token_data)
-    return _token_cache
+    return token_data
 
 
 def _update_token_cache(token_data):
     """Update the token cache with new token data."""
-    global _token_cache, _token_expiry_time, _refresh_token_expiry_time
+    global _token_state
     
-    _token_cache = token_data
+    previous = _token_state
+    now = time.monotonic()
     
-    # Set expiration times with a small buffer (30 seconds) to avoid edge cases
+    # Set expiration times with a small buffer (30 seconds) to avoid edge cases;
+    # a response without an expiry keeps the previous one
+    token_expiry = previous[1] if previous else None
+    refresh_expiry = previous[2] if previous else None
     if 'expires_in' in token_data:
-        _token_expiry_time = datetime.now() + timedelta(seconds=token_data['expires_in'] - 30)
+        token_expiry = now + token_data['expires_in'] - 30
         
     if 'refresh_token_expires_in' in token_data:
-        _refresh_token_expiry_time = datetime.now() + timedelta(seconds=token_data['refresh_token_expires_in'] - 30)
+        refresh_expiry = now + token_data['refresh_token_expires_in'] - 30
+    
+    _token_state = (token_data, token_expiry, refresh_expiry)
 
 
 def get_platform():
@@ -220,6 +243,21 @@ async def call_ringcentral_api(
             # Standard timeout for regular API calls
             timeout = aiohttp.ClientTimeout(total=60, connect=30)
     
+    async def _retry() -> Union[Dict[str, Any], bytes, aiohttp.StreamReader]:
+        # Every retry path re-issues the same request with the next attempt count
+        return await call_ringcentral_api(
+            endpoint=endpoint,
+            method=method,
+            data=data,
+            params=params,
+            retry_count=retry_count + 1,
+            binary=binary,
+            stream=stream,
+            timeout=timeout,
+            auth_type=auth_type,
+            headers=headers
+        )
+
     try:
         async with aiohttp.ClientSession(timeout=timeout) as session:
             # Determine if we need to send as form data or JSON
@@ -243,7 +281,7 @@ async def call_ringcentral_api(
             ) as response:
                 # Handle rate limiting (429)
                 if response.status == 429:
-                    retry_after = int(response.headers.get('Retry-After', 0)) or (2 ** retry_count + random.uniform(0, 1))
+                    retry_after = int(response.headers.get('Retry-After', 0)) or backoff_seconds(retry_count)
                     
                     # Check if we've exceeded max retries
                     if retry_count >= MAX_RETRIES:
@@ -255,18 +293,7 @@ async def call_ringcentral_api(
                     
                     # Wait and retry
                     await asyncio.sleep(retry_after)
-                    return await call_ringcentral_api(
-                        endpoint=endpoint,
-                        method=method,
-                        data=data,
-                        params=params,
-                        retry_count=retry_count+1,
-                        binary=binary,
-                        stream=stream,
-                        timeout=timeout,
-                        auth_type=auth_type,
-                        headers=headers
-                    )
+                    return await _retry()
                 
                 # Handle auth errors (401)
                 if response.status == 401 and auth_type == 'bearer':
@@ -280,18 +307,7 @@ async def call_ringcentral_api(
                     
                     # Force token refresh and retry
                     get_token(force_refresh=True)
-                    return await call_ringcentral_api(
-                        endpoint=endpoint,
-                        method=method,
-                        data=data,
-                        params=params,
-                        retry_count=retry_count+1,
-                        binary=binary,
-                        stream=stream,
-                        timeout=timeout,
-                        auth_type=auth_type,
-                        headers=headers
-                    )
+                    return await _retry()
                 
                 # Handle other errors
                 if response.status < 200 or response.status >= 300:
@@ -311,41 +327,19 @@ async def call_ringcentral_api(
                         # Retry on connection issues during download
                         if retry_count < MAX_RETRIES:
                             await asyncio.sleep(1)  # Brief delay before retry
-                            return await call_ringcentral_api(
-                                endpoint=endpoint,
-                                method=method,
-                                data=data,
-                                params=params,
-                                retry_count=retry_count+1,
-                                binary=binary,
-                                stream=stream,
-                                timeout=timeout,
-                                auth_type=auth_type,
-                                headers=headers
-                            )
+                            return await _retry()
                         else:
                             raise RingCentralApiError(f"Connection closed while downloading: {str(e)}", status_code=0)
                 else:
-                    return await response.json()
+                    return orjson.loads(await response.read())
                     
     except (aiohttp.ClientPayloadError, asyncio.TimeoutError) as e:
         # Handle connection closed or timeout errors specifically
         if retry_count < MAX_RETRIES:
             # Exponential backoff
-            wait_time = (2 ** retry_count) + random.random()
+            wait_time = backoff_seconds(retry_count)
             await asyncio.sleep(wait_time)
-            return await call_ringcentral_api(
-                endpoint=endpoint,
-                method=method,
-                data=data,
-                params=params,
-                retry_count=retry_count+1,
-                binary=binary,
-                stream=stream,
-                timeout=timeout,
-                auth_type=auth_type,
-                headers=headers
-            )
+            return await _retry()
         raise RingCentralApiError(f"Connection error after {retry_count} retries: {str(e)}", status_code=0)
         
     except aiohttp.ClientError as e:
@@ -2,17 +2,61 @@ import os
 import aiohttp
 import asyncio
 import logging
-import random, requests
 from typing import Optional, Dict, Any, Union, BinaryIO
 from pathlib import Path
 
-from app.ringcentral.client import get_platform, call_ringcentral_api
+import orjson
+
+from app.core.config import settings
+from app.ringcentral.client import backoff_seconds, call_ringcentral_api, get_platform
 
 logger = logging.getLogger(__name__)
 
 # Max retry attempts for rate-limited requests
 MAX_RETRIES = 3
 
+# Read size when streaming recordings to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+# Shared HTTP sessions so recording downloads reuse pooled connections. A session's
+# connections belong to the loop that created it, so each event loop gets its own
+_http_sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session for the running event loop, creating it if needed."""
+    loop = asyncio.get_running_loop()
+    session = _http_sessions.get(loop)
+    if session is None or session.closed:
+        _drop_sessions_of_closed_loops()
+        connector = aiohttp.TCPConnector(
+            limit=settings.RINGCENTRAL_MAX_CONNECTIONS,
+            keepalive_timeout=60,
+            ttl_dns_cache=300,
+        )
+        # Recordings can be large, so bound the connect and per-read waits rather than the total
+        timeout = aiohttp.ClientTimeout(total=None, connect=30, sock_read=120)
+        session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        _http_sessions[loop] = session
+    return session
+
+
+def _drop_sessions_of_closed_loops() -> None:
+    """Forget sessions whose event loop has been closed; sessions of live loops are left alone."""
+    for loop in [loop for loop in _http_sessions if loop.is_closed()]:
+        # A closed loop cannot close its transports; detach so the session
+        # no longer holds the connector and is not reported as unclosed
+        _http_sessions.pop(loop).detach()
+
+
+async def close_http_session() -> None:
+    """Close the running loop's shared aiohttp session."""
+    session = _http_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+    _drop_sessions_of_closed_loops()
+
 
 class RingCentralRateLimitError(Exception):
     """Exception raised when RingCentral returns a rate limit error."""
@@ -23,19 +67,16 @@ class RingCentralRateLimitError(Exception):
 
 async def _fetch_recording_metadata(recording_id: str) -> Dict[str, Any]:
     """Fetch recording metadata from RingCentral."""
-    platform_data = get_platform()
+    # A token refresh inside get_platform() is a blocking requests call
+    platform_data = await asyncio.to_thread(get_platform)
     url = f"{platform_data['base_url']}/restapi/v1.0/account/~/recording/{recording_id}"
 
-    response = await asyncio.to_thread(
-        requests.get,
-        url,
-        headers=platform_data['headers']
-    )
-
-    if response.status_code != 200:
-        raise Exception(f"Failed to get recording data: HTTP {response.status_code}")
+    session = get_http_session()
+    async with session.get(url, headers=platform_data['headers']) as response:
+        if response.status != 200:
+            raise Exception(f"Failed to get recording data: HTTP {response.status}")
 
-    return response.json()
+        return orjson.loads(await response.read())
 
 
 async def get_recording_audio_url(recording_id: str) -> str:
@@ -87,39 +128,39 @@ async def download_audio_by_url(url: str, output_path: Union[str, Path], retry_c
     try:
         # For RingCentral URLs that require authentication
         if 'ringcentral.com' in url.lower() or 'rcapi.com' in url.lower():
-            platform_data = get_platform()
+            platform_data = await asyncio.to_thread(get_platform)
             headers = platform_data['headers']
         else:
             headers = {}
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers) as response:
-                # Handle rate limiting
-                if response.status == 429:
-                    # Get retry-after header or use exponential backoff
-                    retry_after = int(response.headers.get('Retry-After', 0)) or (2 ** retry_count + random.uniform(0, 1))
-                    
-                    # Check if we've exceeded max retries
-                    if retry_count >= MAX_RETRIES:
-                        logger.warning(f"Rate limit exceeded for {url} after {retry_count} retries")
-                        raise RingCentralRateLimitError(
-                            f"RingCentral rate limit exceeded. Try again after {retry_after} seconds.", 
-                            retry_after=retry_after
-                        )
-                    
-                    logger.info(f"Rate limited by RingCentral. Retrying in {retry_after} seconds (attempt {retry_count+1}/{MAX_RETRIES})")
-                    await asyncio.sleep(retry_after)
-                    
-                    # Try again with incremented retry count
-                    return await download_audio_by_url(url, output_path, retry_count + 1)
+        session = get_http_session()
+        async with session.get(url, headers=headers) as response:
+            # Handle rate limiting
+            if response.status == 429:
+                # Get retry-after header or use exponential backoff
+                retry_after = int(response.headers.get('Retry-After', 0)) or backoff_seconds(retry_count)
+                
+                # Check if we've exceeded max retries
+                if retry_count >= MAX_RETRIES:
+                    logger.warning(f"Rate limit exceeded for {url} after {retry_count} retries")
+                    raise RingCentralRateLimitError(
+                        f"RingCentral rate limit exceeded. Try again after {retry_after} seconds.", 
+                        retry_after=retry_after
+                    )
+                
+                logger.info(f"Rate limited by RingCentral. Retrying in {retry_after} seconds (attempt {retry_count+1}/{MAX_RETRIES})")
+                await asyncio.sleep(retry_after)
+                
+                # Try again with incremented retry count
+                return await download_audio_by_url(url, output_path, retry_count + 1)
                 
-                if response.status != 200:
-                    raise Exception(f"Failed to download audio file: HTTP {response.status}")
+            if response.status != 200:
+                raise Exception(f"Failed to download audio file: HTTP {response.status}")
                 
-                # Stream the content to file
-                with open(output_path, 'wb') as f:
-                    async for chunk in response.content.iter_chunked(8192):
-                        f.write(chunk)
+            # Stream the content to file
+            with open(output_path, 'wb') as f:
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
         
         return output_path
     
@@ -0,0 +1,139 @@
+import asyncio
+import logging
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Mapping, Optional
+
+from openai import RateLimitError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Reset headers look like "1s", "20ms", "6m0s" or "1h2m3.5s"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    """Convert an x-ratelimit-reset-* or retry-after header value to seconds."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class OpenAIRateLimiter:
+    """
+    Header-driven request/token limiter for one OpenAI deployment.
+
+    Budgets are learned from the x-ratelimit-* response headers, so the limiter
+    starts permissive and paces callers once the deployment reports it is close
+    to its quota, instead of letting concurrent callers run into 429s.
+    """
+
+    def __init__(self, name: str, default_reset_seconds: float = 60.0, max_concurrency: int = 16):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Label used in log messages
+            default_reset_seconds: Wait used when a budget is exhausted but the
+                response did not say when it resets
+            max_concurrency: Maximum number of requests in flight at once
+        """
+        self.name = name
+        self.default_reset_seconds = default_reset_seconds
+        self.in_flight = asyncio.Semaphore(max_concurrency)
+        self.remaining_requests: Optional[int] = None
+        self.remaining_tokens: Optional[int] = None
+        self.reset_at = 0.0
+        self.lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def reserve(self, estimated_tokens: int = 0) -> AsyncIterator["OpenAIRateLimiter"]:
+        """
+        Wait until the deployment has budget for a request, then run it.
+
+        Callers should pass the response headers to update_from_headers() inside
+        the block. A RateLimitError raised inside the block pauses later callers
+        until the reported reset time. At most max_concurrency blocks run at once.
+        """
+        async with self.in_flight:
+            async with self.lock:
+                exhausted = (
+                    (self.remaining_requests is not None and self.remaining_requests <= 0)
+                    or (self.remaining_tokens is not None and self.remaining_tokens < estimated_tokens)
+                )
+                wait_time = 0.0
+                if exhausted:
+                    wait_time = self.reset_at - time.monotonic()
+                else:
+                    if self.remaining_requests is not None:
+                        self.remaining_requests -= 1
+                    if self.remaining_tokens is not None:
+                        self.remaining_tokens -= estimated_tokens
+
+            # Sleep outside the lock so waiting callers share one reset instead
+            # of queueing behind each other's backoff
+            if wait_time > 0:
+                logger.info(f"⏳ {self.name} rate limit reached. Waiting {wait_time:.1f}s before next request...")
+                await asyncio.sleep(wait_time)
+            if exhausted:
+                # The next response refreshes the real budget
+                self.remaining_requests = None
+                self.remaining_tokens = None
+
+            try:
+                yield self
+            except RateLimitError as e:
+                self._mark_exhausted(_parse_reset(e.response.headers.get("retry-after")))
+                raise
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Refresh the remaining budgets from a response's rate limit headers."""
+        remaining_requests = _parse_int(headers.get("x-ratelimit-remaining-requests"))
+        remaining_tokens = _parse_int(headers.get("x-ratelimit-remaining-tokens"))
+        if remaining_requests is not None:
+            self.remaining_requests = remaining_requests
+        if remaining_tokens is not None:
+            self.remaining_tokens = remaining_tokens
+
+        resets = [
+            seconds
+            for seconds in (
+                _parse_reset(headers.get("x-ratelimit-reset-requests")),
+                _parse_reset(headers.get("x-ratelimit-reset-tokens")),
+            )
+            if seconds is not None
+        ]
+        reset_in = max(resets) if resets else self.default_reset_seconds
+        self.reset_at = time.monotonic() + reset_in
+
+    def _mark_exhausted(self, reset_in: Optional[float]) -> None:
+        self.remaining_requests = 0
+        self.reset_at = time.monotonic() + (reset_in if reset_in is not None else self.default_reset_seconds)
+        logger.warning(f"{self.name} returned 429; pausing requests for {self.reset_at - time.monotonic():.1f}s")
+
+
+# Global rate limiter instances, one per deployment
+azure_openai_rate_limiter = OpenAIRateLimiter(
+    "Azure OpenAI", max_concurrency=settings.OPENAI_MAX_CONCURRENCY
+)
+azure_openai_whisper_rate_limiter = OpenAIRateLimiter(
+    "Azure OpenAI Whisper", max_concurrency=settings.OPENAI_MAX_CONCURRENCY
+)
@@ -1,13 +1,16 @@
 import asyncio
-import json
+import logging
 import time
 from typing import Optional
 
+import orjson
 from azure.servicebus import ServiceBusMessage
-from azure.servicebus.aio import ServiceBusClient
+from azure.servicebus.aio import ServiceBusClient, ServiceBusSender
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 
 class ServiceBusManager:
     """Minimal async Service Bus manager without threading or extra complexity."""
@@ -17,6 +20,9 @@ class ServiceBusManager:
         self.running: bool = False
         self.tasks: list[asyncio.Task] = []
         self.queue_names: list[str] = ["audio-processing-queue"]
+        # Open senders reused across sends, one AMQP link per queue
+        self.senders: dict[str, ServiceBusSender] = {}
+        self.senders_lock = asyncio.Lock()
 
     async def start(self) -> None:
         """Initialize the client and start non-blocking listeners."""
@@ -39,31 +45,39 @@ class ServiceBusManager:
             print("Service Bus client not initialized")
             return
 
-        try:
-            receiver = self.client.get_queue_receiver(queue_name=queue_name)
-            async with receiver:
-                while self.running:
-                    try:
-                        messages = await receiver.receive_messages(
-                            max_message_count=10,
-                            max_wait_time=5,
-                        )
-                        for msg in messages:
-                            await self._process_message(msg, queue_name, receiver)
-                    except Exception as e:
-                        if self.running:
-                            print(f"Error receiving from {queue_name}: {e}")
-        except Exception as e:
-            print(f"Failed to setup listener for {queue_name}: {e}")
+        # One receiver (one AMQP link) serves every poll; it is only rebuilt
+        # after the SDK gives up on a receive, instead of the listener stopping for good
+        while self.running:
+            try:
+                receiver = self.client.get_queue_receiver(queue_name=queue_name)
+                async with receiver:
+                    while self.running:
+                        try:
+                            messages = await receiver.receive_messages(
+                                max_message_count=10,
+                                max_wait_time=5,
+                            )
+                            # Messages settle independently, so handle the batch concurrently;
+                            # max_message_count bounds how many run at once
+                            await asyncio.gather(
+                                *(self._process_message(msg, queue_name, receiver) for msg in messages)
+                            )
+                        except Exception as e:
+                            if self.running:
+                                print(f"Error receiving from {queue_name}: {e}; reopening receiver")
+                            break
+            except Exception as e:
+                print(f"Failed to setup listener for {queue_name}: {e}")
+            if self.running:
+                await asyncio.sleep(5)
 
     async def _process_message(self, msg, queue_name: str, receiver) -> None:
         try:
-            body_bytes = b"".join(part for part in msg.body)
-            body = body_bytes.decode("utf-8", errors="replace")
-            print(f"Received from {queue_name}: {body}")
+            body_bytes = b"".join(msg.body)
+            logger.debug("Received from %s: message %s (%d bytes)", queue_name, msg.message_id, len(body_bytes))
 
             if queue_name == "audio-processing-queue":
-                await self._process_audio_message(body, receiver, msg)
+                await self._process_audio_message(body_bytes, receiver, msg)
             else:
                 await receiver.complete_message(msg)
         except Exception as e:
@@ -73,10 +87,10 @@ class ServiceBusManager:
             except Exception:
                 pass
 
-    async def _process_audio_message(self, body: str, receiver, msg) -> None:
+    async def _process_audio_message(self, body: bytes, receiver, msg) -> None:
         lock_task: Optional[asyncio.Task] = None
         try:
-            data = json.loads(body)
+            data = orjson.loads(body)
             audio_url = data.get("audio_url")
             ring_central_id = data.get("ring_central_id")
 
@@ -101,7 +115,7 @@ class ServiceBusManager:
                 )
 
                 processed = response_data.model_dump()
-                encoded = json.dumps(processed).encode("utf-8")
+                encoded = orjson.dumps(processed)
                 await self.send_message(encoded, "audio-response-queue")
                 await receiver.complete_message(msg)
             except RingCentralRateLimitActive as rate_limit_error:
@@ -127,13 +141,31 @@ class ServiceBusManager:
             print("Service Bus client not available")
             return
         try:
-            sender = self.client.get_queue_sender(queue_name=queue_name)
-            async with sender:
-                sb_message = ServiceBusMessage(message)
-                await sender.send_messages(sb_message)
-                print(f"Sent to {queue_name}: {message.decode('utf-8', errors='replace')}")
+            sender = await self._get_sender(queue_name)
+            sb_message = ServiceBusMessage(message)
+            await sender.send_messages(sb_message)
+            logger.debug("Sent to %s: %d bytes", queue_name, len(message))
         except Exception as e:
             print(f"Error sending message to {queue_name}: {e}")
+            # Drop the sender so the next send opens a fresh link
+            await self._close_sender(queue_name)
+
+    async def _get_sender(self, queue_name: str) -> ServiceBusSender:
+        async with self.senders_lock:
+            sender = self.senders.get(queue_name)
+            if sender is None:
+                sender = self.client.get_queue_sender(queue_name=queue_name)
+                self.senders[queue_name] = sender
+            return sender
+
+    async def _close_sender(self, queue_name: str) -> None:
+        async with self.senders_lock:
+            sender = self.senders.pop(queue_name, None)
+        if sender is not None:
+            try:
+                await sender.close()
+            except Exception as e:
+                print(f"Error closing sender for {queue_name}: {e}")
 
     async def stop(self) -> None:
         print("Stopping Service Bus Manager...")
@@ -142,6 +174,9 @@ class ServiceBusManager:
         if self.tasks:
             await asyncio.gather(*self.tasks, return_exceptions=True)
 
+        for queue_name in list(self.senders):
+            await self._close_sender(queue_name)
+
         if self.client:
             try:
                 await self.client.close()
@@ -0,0 +1,92 @@
+import asyncio
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.modules.asr import service as asr_service
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(monkeypatch):
+    monkeypatch.setattr(asr_service, "_analysis_memory_cache", OrderedDict())
+    monkeypatch.setattr(asr_service.db, "database", None)
+
+
+def test_analysis_cache_key_tracks_prompt_model_and_schema(monkeypatch):
+    key = asr_service._analysis_cache_key("prompt")
+    assert key == asr_service._analysis_cache_key("prompt")
+    assert key != asr_service._analysis_cache_key("other prompt")
+
+    monkeypatch.setattr(asr_service, "_CALL_ANALYSIS_RESPONSE_FORMAT_JSON", '{"changed": true}')
+    assert asr_service._analysis_cache_key("prompt") != key
+
+    monkeypatch.undo()
+    monkeypatch.setattr(asr_service, "_CALL_ANALYSIS_MODEL", "another-deployment")
+    assert asr_service._analysis_cache_key("prompt") != key
+
+
+def test_memory_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(asr_service, "_ANALYSIS_MEMORY_CACHE_SIZE", 2)
+
+    async def run():
+        await asr_service._store_cached_analysis("a", "A")
+        await asr_service._store_cached_analysis("b", "B")
+        assert await asr_service._get_cached_analysis("a") == "A"
+        await asr_service._store_cached_analysis("c", "C")
+        return [await asr_service._get_cached_analysis(key) for key in ("a", "b", "c")]
+
+    assert asyncio.run(run()) == ["A", None, "C"]
+
+
+def test_memory_cache_entries_expire(monkeypatch):
+    asr_service._remember_analysis("a", "A")
+    monkeypatch.setattr(asr_service.time, "monotonic", lambda: float("inf"))
+
+    assert asyncio.run(asr_service._get_cached_analysis("a")) is None
+    assert "a" not in asr_service._analysis_memory_cache
+
+
+def test_mongo_hit_is_kept_in_memory(monkeypatch):
+    lookups = []
+
+    class _FakeAnalysisCache:
+        async def find_one(self, query, projection):
+            lookups.append(query)
+            return {"_id": query["_id"], "content": "stored"}
+
+    monkeypatch.setattr(asr_service.db, "database", object())
+    monkeypatch.setattr(asr_service.db, "get_collection", lambda name: _FakeAnalysisCache())
+
+    async def run():
+        return [await asr_service._get_cached_analysis("k") for _ in range(2)]
+
+    assert asyncio.run(run()) == ["stored", "stored"]
+    assert lookups == [{"_id": "k"}]
+
+
+def test_analyze_transcript_reuses_cached_analysis(monkeypatch):
+    calls = []
+
+    async def fake_create_call_analysis(client, prompt):
+        calls.append(prompt)
+        message = SimpleNamespace(content='{"summary": "van lease"}')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    monkeypatch.setattr(asr_service, "get_async_azure_openai_client", lambda: object())
+    monkeypatch.setattr(asr_service, "_create_call_analysis", fake_create_call_analysis)
+    lines = ["AGENT: hello", "CUSTOMER: I want to lease a van"]
+
+    async def run():
+        first = await asr_service._analyze_transcript("hello, I want to lease a van", lines)
+        second = await asr_service._analyze_transcript("hello, I want to lease a van", lines)
+        return first, second
+
+    assert asyncio.run(run()) == ({"summary": "van lease"}, {"summary": "van lease"})
+    assert len(calls) == 1
@@ -0,0 +1,61 @@
+import asyncio
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.modules.asr import cron
+
+
+class _FakeCursor:
+    def __init__(self, documents):
+        self._documents = iter(documents)
+        self.pulled = 0
+
+    def sort(self, *args, **kwargs):
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            document = next(self._documents)
+        except StopIteration:
+            raise StopAsyncIteration
+        self.pulled += 1
+        return document
+
+
+def test_process_ringcentral_calls_bounds_concurrency(monkeypatch):
+    cursor = _FakeCursor([{"_id": index} for index in range(12)])
+
+    class _FakeCalls:
+        def find(self, *args, **kwargs):
+            return cursor
+
+    in_flight = 0
+    peak = 0
+    pulled_ahead = []
+
+    async def fake_process_call(collection, call):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Besides the calls in flight, at most one pulled call waits for a slot
+        pulled_ahead.append(cursor.pulled - call["_id"])
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return call["_id"] % 3 != 0
+
+    monkeypatch.setattr(cron.db, "get_collection", lambda name: _FakeCalls())
+    monkeypatch.setattr(cron, "_process_call", fake_process_call)
+    monkeypatch.setattr(cron.settings, "ASR_CONCURRENCY", 3)
+
+    processed = asyncio.run(cron.process_ringcentral_calls(batch_size=12))
+
+    assert processed == 8
+    assert peak == 3
+    assert max(pulled_ahead) <= 3 + 1
@@ -0,0 +1,97 @@
+import asyncio
+import sys
+from pathlib import Path
+
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.modules.asr import service as asr_service
+from app.modules.asr.schemas import TranscriptionResult
+
+
+class _FakeCursor:
+    def __init__(self, documents):
+        self._documents = iter(documents)
+
+    def sort(self, *args, **kwargs):
+        return self
+
+    def limit(self, *args, **kwargs):
+        return self
+
+    def batch_size(self, *args, **kwargs):
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._documents)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _FakeCalls:
+    def __init__(self, documents, failing_ids=(), error=None):
+        self.documents = documents
+        self.failing_ids = set(failing_ids)
+        self.error = error
+        self.stored = []
+
+    def find(self, *args, **kwargs):
+        return _FakeCursor(self.documents)
+
+    async def bulk_write(self, operations, ordered):
+        if self.error is not None:
+            raise self.error
+        write_errors = []
+        for index, operation in enumerate(operations):
+            call_id = operation._filter["_id"]
+            if call_id in self.failing_ids:
+                write_errors.append({"index": index, "code": 11000, "errmsg": "write failed"})
+            else:
+                self.stored.append(call_id)
+        if write_errors:
+            raise BulkWriteError({"writeErrors": write_errors, "nMatched": len(self.stored)})
+
+
+def _run_manual_transcribe(monkeypatch, calls, limit):
+    async def fake_audio_url(ring_central_id):
+        return f"https://example.com/{ring_central_id}.mp3"
+
+    async def fake_transcribe(url=None, **kwargs):
+        return TranscriptionResult(status="completed", text="hello")
+
+    monkeypatch.setattr(asr_service.db, "database", object())
+    monkeypatch.setattr(asr_service.db, "get_collection", lambda name: calls)
+    monkeypatch.setattr(asr_service, "get_recording_audio_url", fake_audio_url)
+    monkeypatch.setattr(asr_service, "transcribe", fake_transcribe)
+    return asyncio.run(asr_service.manual_transcribe(limit=limit))
+
+
+def test_manual_transcribe_reports_calls_that_were_not_stored(monkeypatch):
+    documents = [{"_id": ObjectId(), "ringCentralId": f"rc-{index}"} for index in range(3)]
+    failing_id = documents[1]["_id"]
+    calls = _FakeCalls(documents, failing_ids={failing_id})
+
+    results = _run_manual_transcribe(monkeypatch, calls, limit=3)
+
+    statuses = {result["call_id"]: result["status"] for result in results}
+    assert statuses[str(failing_id)] == "failed"
+    assert [statuses[str(document["_id"])] for document in (documents[0], documents[2])] == ["completed"] * 2
+    assert failing_id not in calls.stored
+
+
+def test_manual_transcribe_marks_whole_batch_failed_on_write_exception(monkeypatch):
+    documents = [{"_id": ObjectId(), "ringCentralId": f"rc-{index}"} for index in range(2)]
+    calls = _FakeCalls(documents, error=RuntimeError("connection reset"))
+
+    results = _run_manual_transcribe(monkeypatch, calls, limit=2)
+
+    assert len(results) == 2
+    assert all(result["status"] == "failed" for result in results)
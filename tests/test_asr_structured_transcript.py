@@ -1,3 +1,4 @@
+import asyncio
 import sys
 from pathlib import Path
 
@@ -33,3 +34,69 @@ def test_build_structured_entries_splits_newlines_without_speaker():
     assert len(structured) == 2
     assert all(entry["speaker"] == "customer" for entry in structured)
     assert [entry["message"] for entry in structured] == ["First line", "Second line"]
+
+
+def test_generate_structured_transcript_builds_conversation_lines():
+    segments = [
+        {"text": " Hi, this is Sam from Vanaways.", "start": 0.0, "end": 2.0},
+        {"text": "  ", "start": 2.0, "end": 3.0},
+        {"text": " I'm looking for a Transit.", "start": 3.0, "end": 5.0},
+    ]
+
+    structured, lines = asr_service._generate_structured_transcript("Hi there", segments)
+
+    assert [entry["speaker"] for entry in structured] == ["agent", "customer", "customer"]
+    assert lines == ["AGENT: Hi, this is Sam from Vanaways.", "CUSTOMER: I'm looking for a Transit."]
+
+
+def test_build_conversation_truncates_middle_turns(monkeypatch):
+    assert asr_service._build_conversation(["AGENT: Hello"]) == "AGENT: Hello"
+
+    lines = [f"AGENT: turn {i} " + "x" * 50 for i in range(100)]
+    monkeypatch.setattr(asr_service.settings, "ANALYSIS_MAX_TRANSCRIPT_CHARS", 1000)
+    conversation = asr_service._build_conversation(lines)
+
+    assert len(conversation) <= 1100
+    assert conversation.startswith("AGENT: turn 0 ")
+    assert "AGENT: turn 99 " in conversation
+    assert "turns omitted" in conversation
+
+
+def test_build_conversation_cuts_a_single_long_turn(monkeypatch):
+    monkeypatch.setattr(asr_service.settings, "ANALYSIS_MAX_TRANSCRIPT_CHARS", 1000)
+    text = "start " + "word " * 8000 + "finish"
+    _, lines = asr_service._generate_structured_transcript(text, [])
+
+    conversation = asr_service._build_conversation(lines)
+
+    assert len(conversation) <= 1100
+    assert conversation.startswith("AGENT: start word")
+    assert conversation.endswith("word finish")
+    assert "[... transcript truncated ...]" in conversation
+
+
+def test_transcribe_skips_cache_when_analysis_failed(monkeypatch, tmp_path):
+    stored = []
+
+    async def fake_download(output_path, recording_id=None, url=None):
+        return Path(output_path)
+
+    async def fake_transcribe_file(file_path):
+        return "result", False
+
+    async def fake_get_cached(cache_key):
+        raise AssertionError("force should bypass the cache lookup")
+
+    async def fake_store(cache_key, result):
+        stored.append(result)
+
+    monkeypatch.setenv("TEMP_DIR", str(tmp_path))
+    monkeypatch.setattr(asr_service, "download_audio", fake_download)
+    monkeypatch.setattr(asr_service, "_transcribe_file", fake_transcribe_file)
+    monkeypatch.setattr(asr_service, "_get_cached_transcription", fake_get_cached)
+    monkeypatch.setattr(asr_service, "_store_cached_transcription", fake_store)
+    monkeypatch.setattr(asr_service, "_schedule_temp_file_cleanup", lambda path: None)
+
+    result = asyncio.run(asr_service.transcribe(url="https://example.com/a.mp3", force=True))
+    assert result == "result"
+    assert stored == []
@@ -0,0 +1,70 @@
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+from bson import ObjectId
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.modules.asr import tag_service
+
+
+class _FakeCursor:
+    def __init__(self, documents):
+        self._documents = iter(documents)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._documents)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _FakeCalls:
+    def __init__(self, documents):
+        self.documents = documents
+        self.find_args = None
+        self.bulk_writes = []
+
+    def find(self, query, projection, batch_size):
+        self.find_args = (query, projection, batch_size)
+        return _FakeCursor(self.documents)
+
+    async def bulk_write(self, operations, ordered):
+        self.bulk_writes.append((list(operations), ordered))
+        return SimpleNamespace(matched_count=len(operations))
+
+
+def test_update_call_tags_bulk_writes_reformatted_tags_in_batches(monkeypatch):
+    documents = [
+        {"_id": ObjectId(), "tags": {"ford": 2}, "transcription": [{"message": "a ford truck"}]},
+        {"_id": ObjectId(), "tags": ["tesla"], "summary": "asked about a tesla"},
+        {"_id": ObjectId()},
+    ]
+    calls = _FakeCalls(documents)
+    monkeypatch.setattr(tag_service.db, "database", object())
+    monkeypatch.setattr(tag_service.db, "get_collection", lambda name: calls)
+    monkeypatch.setattr(tag_service, "_TAG_BULK_BATCH_SIZE", 2)
+
+    call_ids = [str(document["_id"]) for document in documents]
+    matched = asyncio.run(tag_service.update_call_tags_bulk(call_ids))
+
+    assert matched == 3
+    query, projection, batch_size = calls.find_args
+    assert query == {"_id": {"$in": [document["_id"] for document in documents]}}
+    assert projection == tag_service._TAG_SOURCE_PROJECTION
+    assert batch_size == 2
+
+    assert [len(operations) for operations, _ in calls.bulk_writes] == [2, 1]
+    assert all(ordered is False for _, ordered in calls.bulk_writes)
+    operations = [operation for batch, _ in calls.bulk_writes for operation in batch]
+    for operation, document in zip(operations, documents):
+        assert operation._filter == {"_id": document["_id"]}
+        assert operation._doc == {"$set": {"tags": tag_service._reformat_tags(document)}}
+    assert operations[2]._doc == {"$set": {"tags": []}}
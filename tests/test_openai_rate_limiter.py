@@ -0,0 +1,106 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from openai import RateLimitError
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.azure.openai import openai_rateLimiter as rate_limiter_module
+from app.services.azure.openai.openai_rateLimiter import OpenAIRateLimiter, _parse_reset
+
+
+def test_parse_reset_handles_duration_strings():
+    assert _parse_reset("6m0s") == pytest.approx(360.0)
+    assert _parse_reset("20ms") == pytest.approx(0.02)
+    assert _parse_reset("1h2m3.5s") == pytest.approx(3723.5)
+    assert _parse_reset("2.5") == pytest.approx(2.5)
+    assert _parse_reset("soon") is None
+    assert _parse_reset(None) is None
+
+
+def test_update_from_headers_sets_budgets_and_longest_reset(monkeypatch):
+    monkeypatch.setattr(rate_limiter_module.time, "monotonic", lambda: 100.0)
+    limiter = OpenAIRateLimiter("test")
+
+    limiter.update_from_headers({
+        "x-ratelimit-remaining-requests": "3",
+        "x-ratelimit-remaining-tokens": "1500",
+        "x-ratelimit-reset-requests": "20ms",
+        "x-ratelimit-reset-tokens": "6m0s",
+    })
+
+    assert limiter.remaining_requests == 3
+    assert limiter.remaining_tokens == 1500
+    assert limiter.reset_at == pytest.approx(460.0)
+
+
+def test_reserve_waits_until_reset_when_exhausted(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(rate_limiter_module.time, "monotonic", lambda: 100.0)
+    monkeypatch.setattr(rate_limiter_module.asyncio, "sleep", fake_sleep)
+    limiter = OpenAIRateLimiter("test")
+    limiter.remaining_requests = 0
+    limiter.reset_at = 105.0
+
+    async def run():
+        async with limiter.reserve(estimated_tokens=10):
+            pass
+
+    asyncio.run(run())
+
+    assert sleeps == [pytest.approx(5.0)]
+    assert limiter.remaining_requests is None
+    assert limiter.remaining_tokens is None
+
+
+def test_reserve_releases_slot_when_block_raises():
+    limiter = OpenAIRateLimiter("test", max_concurrency=1)
+    request = httpx.Request("POST", "https://example.com/v1/chat/completions")
+    response = httpx.Response(429, headers={"retry-after": "0.01"}, request=request)
+
+    async def run():
+        with pytest.raises(RateLimitError):
+            async with limiter.reserve():
+                raise RateLimitError("rate limited", response=response, body=None)
+        assert limiter.remaining_requests == 0
+        with pytest.raises(ValueError):
+            async with limiter.reserve():
+                raise ValueError("boom")
+        # Both failed blocks must have handed the only slot back
+        await asyncio.wait_for(limiter.in_flight.acquire(), timeout=1)
+
+    asyncio.run(run())
+
+
+def test_waiting_caller_does_not_block_one_with_budget():
+    limiter = OpenAIRateLimiter("test", max_concurrency=2)
+    limiter.remaining_requests = 5
+    limiter.remaining_tokens = 100
+    limiter.reset_at = rate_limiter_module.time.monotonic() + 0.5
+
+    async def run():
+        # A large request waits for the token budget to reset...
+        large = asyncio.create_task(_reserve_once(limiter, estimated_tokens=1000))
+        await asyncio.sleep(0.05)
+        started = rate_limiter_module.time.monotonic()
+        # ...while a small one that still fits goes straight through
+        await _reserve_once(limiter, estimated_tokens=10)
+        elapsed = rate_limiter_module.time.monotonic() - started
+        await large
+        return elapsed
+
+    assert asyncio.run(run()) < 0.2
+
+
+async def _reserve_once(limiter, estimated_tokens):
+    async with limiter.reserve(estimated_tokens=estimated_tokens):
+        pass
@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.modules.recording.service import _derive_filename_from_headers
+
+URL = "https://media.ringcentral.com/restapi/v1.0/account/~/recording/123/content?token=abc"
+
+
+def test_plain_filename_is_percent_unquoted():
+    header = 'attachment; filename="call%20recording.mp3"'
+    assert _derive_filename_from_headers(URL, header, None) == "call recording.mp3"
+
+
+def test_extended_filename_is_decoded_and_preferred():
+    header = "attachment; filename=fallback.mp3; filename*=UTF-8''caf%C3%A9%20call.mp3"
+    assert _derive_filename_from_headers(URL, header, None) == "café call.mp3"
+
+
+def test_url_path_fallback_without_header():
+    assert _derive_filename_from_headers(URL, None, None) == "content.mp3"
+    assert _derive_filename_from_headers("https://example.com/a/b/rec.wav?x=1", "inline", None) == "rec.wav"
+
+
+def test_explicit_filename_wins():
+    header = 'attachment; filename="ignored.mp3"'
+    assert _derive_filename_from_headers(URL, header, "chosen.mp3") == "chosen.mp3"
@@ -0,0 +1,94 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.modules.recording import routes as recording_routes
+from app.modules.recording import service as recording_service
+from app.modules.recording.schemas import DownloadRequest
+
+
+class _FakeContent:
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def iter_chunked(self, size):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class _FakeResponse:
+    def __init__(self, status=200, headers=None, chunks=()):
+        self.status = status
+        self.headers = headers or {}
+        self.content = _FakeContent(list(chunks))
+        self.released = 0
+
+    def release(self):
+        self.released += 1
+
+
+class _FakeSession:
+    def __init__(self, response):
+        self.response = response
+
+    async def get(self, url, headers=None):
+        return self.response
+
+
+@pytest.fixture
+def fake_upstream(monkeypatch):
+    def install(response):
+        monkeypatch.setattr(recording_service, "_rc_next_allowed_at", 0.0)
+        monkeypatch.setattr(recording_service, "get_platform", lambda: {"headers": {}})
+        monkeypatch.setattr(recording_service, "get_http_session", lambda: _FakeSession(response))
+        return response
+    return install
+
+
+def test_stream_recording_releases_after_body_is_consumed(fake_upstream):
+    response = fake_upstream(_FakeResponse(headers={"Content-Type": "audio/wav"}, chunks=[b"ab", b"cd"]))
+
+    async def run():
+        chunks, content_type, filename, release = await recording_service.stream_recording(
+            "https://media.example.com/rec/42.wav"
+        )
+        body = b"".join([chunk async for chunk in chunks])
+        return body, content_type, filename
+
+    assert asyncio.run(run()) == (b"abcd", "audio/wav", "42.wav")
+    assert response.released == 1
+
+
+def test_download_route_releases_unconsumed_body_in_background(fake_upstream):
+    response = fake_upstream(_FakeResponse(chunks=[b"ab"]))
+
+    async def run():
+        streaming = await recording_routes.download_recording(
+            DownloadRequest(content_url="https://media.example.com/rec/42")
+        )
+        # The client went away before any chunk was read
+        await streaming.background()
+        return streaming
+
+    streaming = asyncio.run(run())
+    assert streaming.headers["content-disposition"] == "attachment; filename=42.mp3"
+    assert response.released == 1
+
+
+def test_stream_recording_rate_limit_releases_and_fails_fast(fake_upstream):
+    response = fake_upstream(_FakeResponse(status=429, headers={"Retry-After": "30"}))
+
+    async def run():
+        for _ in range(2):
+            with pytest.raises(recording_service.RingCentralRateLimitActive):
+                await recording_service.stream_recording("https://media.example.com/rec/42")
+
+    asyncio.run(run())
+    # The second call fails fast on the stored deadline without another request
+    assert response.released == 1
@@ -0,0 +1,96 @@
+import asyncio
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.azure.service_bus import ServiceBusManager
+
+
+class _FakeSender:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.sent = []
+        self.closed = False
+
+    async def send_messages(self, message):
+        if self.fail:
+            raise ConnectionError("link detached")
+        self.sent.append(message)
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeClient:
+    def __init__(self, senders):
+        self._senders = iter(senders)
+        self.opened = 0
+
+    def get_queue_sender(self, queue_name):
+        self.opened += 1
+        return next(self._senders)
+
+
+def _manager(senders):
+    manager = ServiceBusManager()
+    manager.client = _FakeClient(senders)
+    manager.running = True
+    return manager
+
+
+def test_send_message_reuses_one_sender_per_queue():
+    sender = _FakeSender()
+    manager = _manager([sender])
+
+    async def run():
+        await asyncio.gather(*(manager.send_message(b"{}", "results") for _ in range(3)))
+
+    asyncio.run(run())
+    assert manager.client.opened == 1
+    assert len(sender.sent) == 3
+
+
+def test_failed_send_drops_the_sender_for_a_fresh_link():
+    broken, healthy = _FakeSender(fail=True), _FakeSender()
+    manager = _manager([broken, healthy])
+
+    async def run():
+        await manager.send_message(b"{}", "results")
+        await manager.send_message(b"{}", "results")
+
+    asyncio.run(run())
+    assert broken.closed
+    assert manager.client.opened == 2
+    assert len(healthy.sent) == 1
+    assert manager.senders == {"results": healthy}
+
+
+class _FakeMessage:
+    def __init__(self, message_id, body):
+        self.message_id = message_id
+        self.body = [body]
+
+
+class _FakeReceiver:
+    def __init__(self):
+        self.completed = []
+
+    async def complete_message(self, message):
+        self.completed.append(message.message_id)
+
+
+def test_messages_without_an_audio_url_are_completed():
+    manager = ServiceBusManager()
+    receiver = _FakeReceiver()
+    messages = [_FakeMessage(str(index), b'{"ring_central_id": "rc"}') for index in range(3)]
+
+    async def run():
+        await asyncio.gather(
+            *(manager._process_message(message, "audio-processing-queue", receiver) for message in messages)
+        )
+
+    asyncio.run(run())
+    assert sorted(receiver.completed) == ["0", "1", "2"]
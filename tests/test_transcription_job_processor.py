@@ -0,0 +1,62 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import orjson
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.modules.asr.service import TranscriptionResult
+from app.modules.transcription import job_processor
+
+
+def _stub_groq_prompts(monkeypatch):
+    service = job_processor.transcription_service
+    monkeypatch.setattr(service, "analyze_sentiment", lambda client, text: ("positive", 0.9))
+    monkeypatch.setattr(service, "rate_call", lambda client, text: (4, "helpful agent"))
+    monkeypatch.setattr(service, "extract_keywords", lambda client, text: {"van": 2})
+    monkeypatch.setattr(service, "get_client_details", lambda client, text: {"name": "Sam", "email": "sam@example.com"})
+    monkeypatch.setattr(service, "make_transcription_readable", lambda client, text: f"Agent: {text}")
+
+
+def test_process_transcription_job_collects_all_groq_results(monkeypatch):
+    _stub_groq_prompts(monkeypatch)
+
+    result = asyncio.run(job_processor.process_transcription_job(
+        {"callId": "call-1", "call_transcript": "looking for a van", "timestamp": "t0"},
+        groq_client=object(),
+    ))
+
+    assert result.transcription is None
+    assert result.data["callId"] == "call-1"
+    assert result.data["sentiment"] == "positive"
+    assert result.data["call_rating"] == 4
+    assert result.data["keywords"] == {"van": 2}
+    assert result.data["client_name"] == "Sam"
+    assert result.data["formatted_transcript"] == "Agent: looking for a van"
+    assert result.data["buyer_intent"] is None
+    assert result.data["timestamp"] == "t0"
+    assert orjson.loads(job_processor.dump_processed_transcription(result))["callId"] == "call-1"
+
+
+def test_process_transcription_job_transcribes_recording_url(monkeypatch):
+    _stub_groq_prompts(monkeypatch)
+    requested = []
+
+    async def fake_transcribe(url=None):
+        requested.append(url)
+        return TranscriptionResult(status="completed", text="transcribed call", buyer_intent="high")
+
+    monkeypatch.setattr(job_processor, "transcribe", fake_transcribe)
+
+    result = asyncio.run(job_processor.process_transcription_job(
+        {"callId": "call-2", "recordingUrl": "https://example.com/rec.mp3"},
+        groq_client=object(),
+    ))
+
+    assert requested == ["https://example.com/rec.mp3"]
+    assert result.data["call_transcript"] == "transcribed call"
+    assert result.data["buyer_intent"] == "high"
+    assert result.data["transcription"]["status"] == "completed"